@@ -0,0 +1,77 @@
+"""
+다운로드 속도 기록 모듈 - 최근 구성 요소 다운로드 속도로 동시 다운로드 수 조절
+"""
+import os
+import json
+import threading
+import statistics
+from typing import List, Optional
+
+from core.constants import USER_DATA_DIR
+
+# 유지할 최근 측정값 개수
+MAX_SAMPLES = 9
+# 동시 다운로드 1개당 기준 속도 (MB/s)
+MBPS_PER_THREAD = 5
+# 이보다 적게 받았거나 짧게 걸린 다운로드는 속도를 대표하지 못하므로 기록하지 않음
+MIN_SAMPLE_BYTES = 1024 * 1024
+MIN_SAMPLE_MS = 200
+# 측정값으로 정하는 동시 다운로드 수 범위
+MIN_THREADS = 2
+MAX_THREADS = 8
+
+
+def _get_stats_path() -> str:
+    """다운로드 속도 기록 파일 경로 반환"""
+    cache_dir = os.path.join(os.path.expanduser("~"), "Documents", USER_DATA_DIR, "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "bw.json")
+
+
+class BandwidthStats:
+    """최근 다운로드 속도(MB/s) 기록 (여러 다운로드 스레드에서 함께 사용)"""
+
+    def __init__(self, path: str = None):
+        self.path = path or _get_stats_path()
+        self._lock = threading.Lock()
+        self._samples: List[float] = self._load()
+
+    def _load(self) -> List[float]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return [float(v) for v in json.load(f)][-MAX_SAMPLES:]
+        except (OSError, ValueError, TypeError):
+            return []
+
+    def save(self) -> None:
+        """기록 파일 저장 (임시 파일 작성 후 교체)"""
+        with self._lock:
+            samples = list(self._samples)
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(samples, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"다운로드 속도 기록 저장 실패: {e}")
+
+    def record(self, size_bytes: int, elapsed_ms: int) -> None:
+        """다운로드 한 건의 속도 기록 (너무 작거나 짧은 다운로드는 무시)"""
+        if size_bytes < MIN_SAMPLE_BYTES or elapsed_ms < MIN_SAMPLE_MS:
+            return
+        mbps = size_bytes / (1024 * 1024) / (elapsed_ms / 1000)
+        with self._lock:
+            self._samples.append(mbps)
+            del self._samples[:-MAX_SAMPLES]
+
+    def median_mbps(self) -> Optional[float]:
+        """최근 다운로드 속도 중앙값 (기록이 없으면 None)"""
+        with self._lock:
+            return statistics.median(self._samples) if self._samples else None
+
+    def suggested_threads(self) -> int:
+        """최근 속도에 맞춘 동시 다운로드 수 (기록이 없으면 최대값)"""
+        median = self.median_mbps()
+        if median is None:
+            return MAX_THREADS
+        return max(MIN_THREADS, min(MAX_THREADS, round(median / MBPS_PER_THREAD)))
@@ -0,0 +1,75 @@
+"""
+구성 요소 설치 기록 모듈 - 이미 받은 구성 요소의 지문(버전, 해시, 크기, 수정 시각) 관리
+"""
+import os
+import json
+import threading
+from typing import Dict
+
+from core.constants import USER_DATA_DIR
+
+# 기록 형식이 바뀌면 올려서 이전 기록을 무효화
+CACHE_VERSION = 1
+
+
+def _get_manifest_path() -> str:
+    """구성 요소 기록 파일 경로 반환"""
+    cache_dir = os.path.join(os.path.expanduser("~"), "Documents", USER_DATA_DIR, "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "components.json")
+
+
+class ComponentManifest:
+    """구성 요소 이름 -> 설치 지문 기록 (여러 다운로드 스레드에서 함께 사용)"""
+
+    def __init__(self, path: str = None):
+        self.path = path or _get_manifest_path()
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self.load()
+
+    def load(self) -> Dict[str, Dict]:
+        """기록 파일 읽기 (없거나 형식 버전이 다르면 빈 기록)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                return data.get("components", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {}
+
+    def save(self) -> None:
+        """기록 파일 저장 (임시 파일 작성 후 교체)"""
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": CACHE_VERSION, "components": self._entries}, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"구성 요소 기록 저장 실패: {e}")
+
+    def matches(self, component: Dict, installed_path: str) -> bool:
+        """설치된 파일이 요청된 구성 요소와 같은지 확인 (파일 내용을 다시 읽지 않음)"""
+        with self._lock:
+            entry = self._entries.get(component["name"])
+        if not entry:
+            return False
+        if entry["version"] != component.get("version") or entry["sha256"] != component.get("hash"):
+            return False
+        try:
+            stat = os.stat(installed_path)
+        except OSError:
+            return False
+        return stat.st_size == entry["size"] and stat.st_mtime == entry["mtime"]
+
+    def update(self, component: Dict, installed_path: str) -> None:
+        """검증을 마치고 설치한 구성 요소의 지문 기록"""
+        stat = os.stat(installed_path)
+        with self._lock:
+            self._entries[component["name"]] = {
+                "version": component.get("version"),
+                "sha256": component.get("hash"),
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+            }
+            self.save()
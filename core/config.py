@@ -46,6 +46,9 @@ class ConfigManager:
         # 설정 데이터 로드
         self.config = self._load_config()
         
+        # 설정 변경 버전 (값이 바뀔 때마다 증가, 스냅샷 캐시 무효화용)
+        self.version = 0
+        
         ConfigManager._initialized = True
     
     def _load_config(self) -> Dict[str, Any]:
@@ -87,6 +90,7 @@ class ConfigManager:
         """
         if self.config.get(key) != value:
             self.config[key] = value
+            self.version += 1
             self.logger.info(f"설정 값이 변경되었습니다: {key}={value}")
         else:
             self.logger.debug(f"설정 값이 변경되지 않았습니다: {key}={value}")
@@ -124,6 +128,7 @@ class ConfigManager:
                 key = key.value
             self.config[key] = value
             self.logger.info(f"설정 값이 변경되었습니다: {key}={value}")
+        self.version += 1
             
         # 한 번만 저장
         if not self.save():
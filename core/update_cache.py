@@ -0,0 +1,96 @@
+"""
+업데이트 확인 결과 캐시 모듈 - 메모리 + 디스크 TTL 캐시
+"""
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from core.constants import USER_DATA_DIR
+
+# 업데이트 확인 결과 유지 시간 (초)
+UPDATE_CHECK_TTL = 300
+
+
+def _get_cache_path() -> str:
+    """업데이트 캐시 파일 경로 반환"""
+    cache_dir = os.path.join(os.path.expanduser("~"), "Documents", USER_DATA_DIR, "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "update.json")
+
+
+def _read_entries(path: str) -> Dict[str, Any]:
+    """디스크 캐시 전체 읽기 (없거나 깨졌으면 빈 딕셔너리)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_entry(path: str, key: str, entry: list) -> None:
+    """디스크 캐시에 항목 하나 기록 (임시 파일 작성 후 교체)"""
+    entries = _read_entries(path)
+    entries[key] = entry
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"업데이트 캐시 저장 실패: {e}")
+
+
+class TtlCache:
+    """
+    JSON으로 저장 가능한 값을 메모리(LRU)와 디스크에 ttl초 동안 보관하는 캐시
+
+    Args:
+        ttl: 캐시 유지 시간 (초)
+        path: 디스크 캐시 파일 경로 (None이면 사용자 데이터 폴더의 cache/update.json)
+        maxsize: 메모리에 유지할 최대 항목 수
+    """
+
+    def __init__(self, ttl: int = UPDATE_CHECK_TTL, path: Optional[str] = None, maxsize: int = 4):
+        self.ttl = ttl
+        self.path = path
+        self.maxsize = maxsize
+        self._memory: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key: str, entry: list) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """(적중 여부, 값) 반환 - 만료된 항목은 적중으로 보지 않음"""
+        with self._lock:
+            entry = self._memory.get(key) or _read_entries(self.path or _get_cache_path()).get(key)
+            # [저장 시각, 값] 형태가 아닌 항목은 캐시에 없는 것으로 처리
+            if (isinstance(entry, list) and len(entry) == 2
+                    and isinstance(entry[0], (int, float))
+                    and time.time() - entry[0] < self.ttl):
+                self._remember(key, entry)
+                return True, entry[1]
+        return False, None
+
+    def store(self, key: str, value: Any) -> None:
+        """값을 현재 시각과 함께 메모리/디스크에 저장"""
+        entry = [time.time(), value]
+        with self._lock:
+            self._remember(key, entry)
+            _write_entry(self.path or _get_cache_path(), key, entry)
+
+
+# 업데이트 확인 결과 캐시 (업데이트 다이얼로그가 사용)
+update_check_cache = TtlCache()
+
+
+def update_check_key(updater) -> str:
+    """업데이트 확인 결과 캐시 키 (서버 주소 + 현재 버전)"""
+    return f"{updater.update_url}|{updater.current_version}"
@@ -2,10 +2,31 @@ import os
 import sys
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import subprocess
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Callable
+
+# 릴리스 정보 파싱은 orjson이 있으면 사용 (없으면 표준 json)
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# 이 크기 이상이고 서버가 Range를 지원하면 구간을 나눠 동시에 내려받음
+RANGE_DOWNLOAD_MIN_SIZE = 16 * 1024 * 1024
+# 구간 다운로드 동시 연결 수
+RANGE_DOWNLOAD_CONNECTIONS = 4
+# 구간 다운로드 시 한 번에 읽는 크기 (작으면 청크당 오버헤드가 커짐)
+RANGE_CHUNK_SIZE = 1024 * 1024
+# 단일 스트림 다운로드/해시 계산 블록 크기 (CPU 캐시에 들어가는 크기)
+STREAM_CHUNK_SIZE = 64 * 1024
+# 다운로드 파일 쓰기 버퍼 크기 - 받은 청크를 모아 write 호출 한 번으로 기록
+WRITE_BUFFER_SIZE = 1024 * 1024
 
 class Updater:
     def __init__(self, current_version: str, update_url: str, github_token: Optional[str] = None):
@@ -16,14 +37,34 @@ class Updater:
         self.github_token = github_token
         self.headers = {"Authorization": f"token {github_token}"} if github_token else {}
         
+        # 같은 서버로 가는 요청은 연결을 재사용 (구성 요소마다 TLS 핸드셰이크 반복 방지)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+    @property
+    def version_url(self) -> str:
+        """최신 버전 정보 주소"""
+        return f"{self.update_url}/version"
+
+    def newer_version_info(self, latest_info: Dict) -> Optional[Dict]:
+        """서버 버전 정보가 현재 버전보다 새로우면 그대로, 아니면 None을 반환합니다."""
+        if self._compare_versions(latest_info["tag_name"], self.current_version):
+            return latest_info
+        return None
+
+    def parse_version_info(self, content: bytes) -> Optional[Dict]:
+        """버전 정보 응답 본문을 파싱해 새 버전 정보를 반환합니다 (최신이면 None)."""
+        return self.newer_version_info(_json.loads(content))
+
     def check_for_updates(self) -> Optional[Dict]:
         """서버에서 최신 버전 정보를 확인합니다."""
         try:
-            response = requests.get(f"{self.update_url}/version", headers=self.headers)
+            response = self.session.get(self.version_url, headers=self.headers)
             if response.status_code == 200:
-                latest_info = response.json()
-                if self._compare_versions(latest_info["tag_name"], self.current_version):
-                    return latest_info
+                return self.parse_version_info(response.content)
         except Exception as e:
             print(f"업데이트 확인 중 오류 발생: {e}")
         return None
@@ -31,9 +72,9 @@ class Updater:
     def check_component_updates(self) -> List[Dict]:
         """업데이트가 필요한 구성 요소들을 확인합니다."""
         try:
-            response = requests.get(f"{self.update_url}/components", headers=self.headers)
+            response = self.session.get(f"{self.update_url}/components", headers=self.headers)
             if response.status_code == 200:
-                server_components = response.json()["components"]
+                server_components = _json.loads(response.content)["components"]
                 local_components = self._get_local_components()
                 
                 updates_needed = []
@@ -46,33 +87,196 @@ class Updater:
             print(f"구성 요소 업데이트 확인 중 오류 발생: {e}")
         return []
 
-    def download_component(self, component: Dict) -> bool:
-        """특정 구성 요소를 다운로드합니다."""
+    def download_component(self, component: Dict,
+                           on_progress: Optional[Callable[[int, int], None]] = None) -> bool:
+        """특정 구성 요소를 다운로드합니다.
+
+        on_progress가 주어지면 청크를 쓸 때마다 (받은 바이트, 전체 바이트)로 호출합니다.
+        전체 크기를 모르면 전체 바이트는 0입니다.
+        """
         try:
             # GitHub Releases에서 직접 다운로드
-            response = requests.get(component["download_url"], stream=True, headers=self.headers)
-            if response.status_code == 200:
-                # 임시 파일로 다운로드
-                temp_path = f"{component['name']}.tmp"
-                with open(temp_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                
+            url = component["download_url"]
+            temp_path = self.get_temp_path(component)
+            
+            # 큰 파일은 Range 요청으로 나눠 받고, 실패하면 단일 스트림으로 다시 받음
+            # 구간은 순서 없이 도착하므로 해시는 다 받은 뒤 파일에서 계산하고,
+            # 단일 스트림은 쓰면서 바로 해시를 계산함
+            # 이전에 받다 만 파일이 있으면 구간 다운로드 대신 이어받기
+            digest = None
+            if not self._load_part_info(temp_path, url):
+                size = self._get_range_download_size(url, component.get("size"))
+                if size and self._download_ranges(url, temp_path, size, on_progress):
+                    digest = self._file_hash(temp_path)
+            if digest is None:
+                digest = self._download_single(url, temp_path, on_progress)
+            
+            if digest is not None:
                 # 해시 검증
-                if self._verify_hash(temp_path, component["hash"]):
+                if digest == component["hash"]:
                     # 실제 파일로 이동
-                    final_path = os.path.join(self.components_dir, component["name"])
+                    final_path = self.get_component_path(component)
                     os.makedirs(os.path.dirname(final_path), exist_ok=True)
                     os.replace(temp_path, final_path)
+                    self._remove_part_info(temp_path)
                     return True
                 else:
                     os.remove(temp_path)
+                    self._remove_part_info(temp_path)
                     print(f"해시 검증 실패: {component['name']}")
         except Exception as e:
             print(f"구성 요소 다운로드 중 오류 발생: {e}")
         return False
 
+    def get_component_path(self, component: Dict) -> str:
+        """구성 요소가 설치되는 경로를 반환합니다."""
+        return os.path.join(self.components_dir, component["name"])
+
+    def get_temp_path(self, component: Dict) -> str:
+        """구성 요소를 받는 동안 쓰는 임시 파일 경로를 반환합니다."""
+        return f"{component['name']}.part"
+
+    def _download_single(self, url: str, temp_path: str,
+                         on_progress: Optional[Callable[[int, int], None]]) -> Optional[str]:
+        """단일 스트림으로 임시 파일에 다운로드하고 SHA-256 해시를 반환합니다 (실패 시 None).
+
+        같은 URL을 받다 만 임시 파일이 있으면 Range 요청으로 이어받습니다.
+        서버 파일이 바뀌었으면(If-Range 불일치) 서버가 전체를 보내므로 처음부터 다시 씁니다.
+        """
+        headers = self.headers
+        existing = 0
+        part_info = self._load_part_info(temp_path, url)
+        if part_info:
+            existing = os.path.getsize(temp_path)
+            headers = dict(self.headers, Range=f"bytes={existing}-")
+            if part_info.get("etag"):
+                headers["If-Range"] = part_info["etag"]
+        
+        response = self.session.get(url, stream=True, headers=headers)
+        if response.status_code == 206 and existing:
+            # 이어받기: 기존 부분의 해시를 먼저 계산한 뒤 뒤에 덧붙임
+            mode = 'ab'
+            sha256_hash = self._file_hash_object(temp_path)
+        elif response.status_code == 200:
+            mode = 'wb'
+            existing = 0
+            sha256_hash = hashlib.sha256()
+        else:
+            # 이어받기가 거절되면(예: 416) 다음 시도는 처음부터 받도록 정리
+            if existing:
+                os.remove(temp_path)
+                self._remove_part_info(temp_path)
+            return None
+        
+        total_bytes = int(response.headers.get("Content-Length") or 0)
+        if total_bytes:
+            total_bytes += existing
+        self._save_part_info(temp_path, url, response.headers.get("ETag"), total_bytes)
+        
+        done_bytes = existing
+        with open(temp_path, mode, buffering=WRITE_BUFFER_SIZE) as f:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                if chunk:
+                    f.write(chunk)
+                    sha256_hash.update(chunk)
+                    if on_progress:
+                        done_bytes += len(chunk)
+                        on_progress(done_bytes, total_bytes)
+        return sha256_hash.hexdigest()
+
+    def _get_range_download_size(self, url: str, known_size: Optional[int]) -> int:
+        """구간 다운로드가 가능하면 파일 크기를, 아니면 0을 반환합니다."""
+        # 작은 파일로 알려져 있으면 HEAD 요청도 생략
+        if known_size is not None and known_size < RANGE_DOWNLOAD_MIN_SIZE:
+            return 0
+        try:
+            response = self.session.head(url, headers=self.headers, allow_redirects=True)
+            size = int(response.headers.get("Content-Length") or 0)
+            if (response.status_code == 200
+                    and response.headers.get("Accept-Ranges") == "bytes"
+                    and size >= RANGE_DOWNLOAD_MIN_SIZE):
+                return size
+        except Exception as e:
+            print(f"구간 다운로드 확인 실패: {e}")
+        return 0
+
+    def _download_ranges(self, url: str, temp_path: str, size: int,
+                         on_progress: Optional[Callable[[int, int], None]]) -> bool:
+        """Range 요청 여러 개를 동시에 보내 각 구간을 파일의 해당 위치에 씁니다."""
+        part = -(-size // RANGE_DOWNLOAD_CONNECTIONS)
+        ranges = [(lo, min(lo + part, size) - 1) for lo in range(0, size, part)]
+        lock = threading.Lock()
+        done = [0]
+        
+        def fetch(lo: int, hi: int) -> bool:
+            headers = dict(self.headers, Range=f"bytes={lo}-{hi}")
+            # 206이 아니어도 스트리밍 연결을 세션 풀에 바로 돌려주도록 with로 닫음
+            with self.session.get(url, stream=True, headers=headers) as response:
+                if response.status_code != 206:
+                    return False
+                with open(temp_path, 'r+b', buffering=WRITE_BUFFER_SIZE) as f:
+                    f.seek(lo)
+                    for chunk in response.iter_content(chunk_size=RANGE_CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+                            if on_progress:
+                                with lock:
+                                    done[0] += len(chunk)
+                                    on_progress(done[0], size)
+            return True
+        
+        try:
+            # 각 구간이 제 위치에 쓸 수 있도록 전체 크기로 미리 할당
+            with open(temp_path, 'wb') as f:
+                f.truncate(size)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                results = list(executor.map(lambda r: fetch(*r), ranges))
+            if all(results):
+                return True
+        except Exception as e:
+            print(f"구간 다운로드 실패, 단일 다운로드로 전환: {e}")
+        
+        # 미리 할당한 파일에는 빈 구간이 섞여 있으므로 이어받기 대상이 되지 않게 삭제
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return False
+
+    @staticmethod
+    def _part_info_path(temp_path: str) -> str:
+        return f"{temp_path}.json"
+
+    def _load_part_info(self, temp_path: str, url: str) -> Optional[Dict]:
+        """이어받을 수 있는 임시 파일 정보를 반환합니다 (URL이 다르거나 없으면 정리 후 None)."""
+        info_path = self._part_info_path(temp_path)
+        try:
+            with open(info_path, 'r', encoding='utf-8') as f:
+                info = json.load(f)
+            if info.get("url") == url and os.path.getsize(temp_path) > 0:
+                return info
+        except (OSError, ValueError):
+            pass
+        
+        # 다른 파일을 받던 흔적이면 이어받지 않음
+        for path in (temp_path, info_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return None
+
+    def _save_part_info(self, temp_path: str, url: str, etag: Optional[str], size: int) -> None:
+        """임시 파일 옆에 이어받기용 정보(url, etag, size)를 기록합니다."""
+        with open(self._part_info_path(temp_path), 'w', encoding='utf-8') as f:
+            json.dump({"url": url, "etag": etag, "size": size}, f)
+
+    def _remove_part_info(self, temp_path: str) -> None:
+        try:
+            os.remove(self._part_info_path(temp_path))
+        except OSError:
+            pass
+
     def _get_local_components(self) -> List[Dict]:
         """로컬 구성 요소 정보를 가져옵니다."""
         components = []
@@ -85,17 +289,21 @@ class Updater:
             print(f"로컬 구성 요소 정보 읽기 실패: {e}")
         return components
 
-    def _verify_hash(self, file_path: str, expected_hash: str) -> bool:
-        """파일의 해시값을 검증합니다."""
+    def _file_hash_object(self, file_path: str):
+        """파일 내용으로 갱신한 SHA-256 해시 객체를 반환합니다."""
+        sha256_hash = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for byte_block in iter(lambda: f.read(STREAM_CHUNK_SIZE), b""):
+                sha256_hash.update(byte_block)
+        return sha256_hash
+
+    def _file_hash(self, file_path: str) -> Optional[str]:
+        """파일의 SHA-256 해시값을 계산합니다 (실패 시 None)."""
         try:
-            sha256_hash = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest() == expected_hash
+            return self._file_hash_object(file_path).hexdigest()
         except Exception as e:
-            print(f"해시 검증 중 오류 발생: {e}")
-            return False
+            print(f"해시 계산 중 오류 발생: {e}")
+            return None
 
     def _compare_versions(self, version1: str, version2: str) -> bool:
         """버전을 비교하여 version1이 더 새로운지 확인합니다."""
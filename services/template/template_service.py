@@ -3,6 +3,7 @@
 """
 
 import os
+import re
 import json
 import sys
 from datetime import datetime, timedelta
@@ -18,6 +19,9 @@ from core.constants import (
 from core.config import ConfigManager
 from services.api_service import ApiService
 
+# 템플릿 변수 {변수명} 패턴
+_VAR_RE = re.compile(r'\{([a-zA-Z0-9_]+)\}')
+
 
 class TemplateService:
     """템플릿 서비스 클래스"""
@@ -178,11 +182,8 @@ class TemplateService:
         Returns:
             List[str]: 변수 목록
         """
-        import re
-        
         # {변수명} 패턴 추출
-        pattern = r'\{([a-zA-Z0-9_]+)\}'
-        matches = re.findall(pattern, content)
+        matches = _VAR_RE.findall(content)
         
         # 중복 제거
         return list(set(matches))
@@ -465,7 +466,7 @@ class TemplateService:
                                             quality_names.append(quality_name)
                                     
                                     if quality_names:
-                                        special_vars["swatch_no_stock"] = "\n".join([f"{i+1}) {name}" for i, name in enumerate(quality_names)])
+                                        special_vars["swatch_no_stock"] = "\n".join(f"{i}) {name}" for i, name in enumerate(quality_names, 1))
                                     else:
                                         special_vars["swatch_no_stock"] = ""
                                 
@@ -480,18 +481,17 @@ class TemplateService:
                 if additional_contents:
                     content = content + "\n\n" + "\n\n".join(additional_contents)
             
-            # 변수 치환 (예외 방어)
-            import re
-            pattern = r'\{([a-zA-Z0-9_]+)\}'
-            matches = re.findall(pattern, content)
-            for var in matches:
+            # 변수 치환 (한 번의 스캔으로 모든 변수 치환, 예외 방어)
+            def substitute(match):
+                var = match.group(1)
                 try:
                     value = data.get(var, "")
-                    content = content.replace(f"{{{var}}}", str(value) if value is not None else "")
+                    return str(value) if value is not None else ""
                 except Exception as e:
                     self.logger.warning(f"템플릿 변수 치환 중 오류: {{{var}}} → '' (에러: {str(e)})")
-                    content = content.replace(f"{{{var}}}", "")
-            return content
+                    return ""
+            
+            return _VAR_RE.sub(substitute, content)
         except Exception as e:
             self.logger.error(f"메시지 렌더링 중 오류: {str(e)}")
             return None
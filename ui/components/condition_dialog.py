@@ -16,6 +16,12 @@ from core.logger import get_logger
 from core.config import ConfigManager
 from ui.theme import get_theme
 
+# 기존 액션 타입 이름 -> 현재 액션 타입 이름
+LEGACY_ACTION_TYPES = {
+    "템플릿 내용 변경": "내용 추가",
+    "템플릿 타입 변경": "내용 변경",
+}
+
 class ConditionDialog(QDialog):
     """조건부 템플릿 생성/수정 다이얼로그 클래스"""
     
@@ -252,10 +258,7 @@ class ConditionDialog(QDialog):
         # 액션 타입 설정
         action_type = self.condition.get("action_type", "내용 추가")
         # 기존 데이터 호환성을 위해 매핑
-        if action_type == "템플릿 내용 변경":
-            action_type = "내용 추가"
-        elif action_type == "템플릿 타입 변경":
-            action_type = "내용 변경"
+        action_type = LEGACY_ACTION_TYPES.get(action_type, action_type)
         self.action_type.setCurrentText(action_type)
         self._on_action_type_changed(action_type)
         
@@ -8,6 +8,7 @@ from PySide6.QtWidgets import QMessageBox
 import json
 import os
 import glob
+import re
 
 from core.types import OrderType, FboOperationType, SboOperationType, ShipmentStatus
 from services.api_service import ApiService
@@ -573,24 +574,16 @@ class DataManager(QObject):
             self.current_status_filter = status_filter
             
             # 전체 데이터에서 시작
-            filtered_data = self.data.copy()
+            filtered_data = self.data
             
-            # 검색어 필터 적용
-            if search_text:
-                search_text_lower = search_text.lower()
-                filtered_data = [
-                    item for item in filtered_data 
-                    if (search_text_lower in item.store_name.lower() or 
-                        search_text_lower in item.purchase_code.lower())
-                ]
-            
-            # 상태 필터 적용
+            # 상태 필터 먼저 적용 (단순 비교라 저렴하고, 검색 대상 수를 줄여준다)
             if status_filter != "all":
                 if status_filter == ShipmentStatus.PENDING.value:
                     # 대기중: 메시지 상태가 대기중인 항목들
+                    pending_values = (ShipmentStatus.PENDING.value, "대기중", "")
                     filtered_data = [
                         item for item in filtered_data 
-                        if getattr(item, 'message_status', '대기중') in [ShipmentStatus.PENDING.value, "대기중", ""]
+                        if getattr(item, 'message_status', '대기중') in pending_values
                     ]
                 else:
                     # 특정 메시지 상태 항목만
@@ -599,6 +592,34 @@ class DataManager(QObject):
                         if getattr(item, 'message_status', '대기중') == status_filter
                     ]
             
+            # 남은 항목에만 검색어 필터 적용 (공백으로 구분된 모든 검색어 포함)
+            search_terms = self._normalize_search_terms(search_text)
+            if len(search_terms) == 1:
+                search_text_lower = search_terms[0]
+                filtered_data = [
+                    item for item in filtered_data 
+                    if (search_text_lower in item.store_name.lower() or 
+                        search_text_lower in item.purchase_code.lower())
+                ]
+            elif search_terms:
+                # 검색어 전체를 하나의 정규식으로 묶어 항목당 한 번만 훑는다
+                pattern = re.compile(
+                    "(?=(" + "|".join(map(re.escape, search_terms)) + "))",
+                    re.IGNORECASE
+                )
+                term_count = len(search_terms)
+                filtered_data = [
+                    item for item in filtered_data
+                    if len({
+                        match.group(1).lower()
+                        for match in pattern.finditer(f"{item.store_name}\n{item.purchase_code}")
+                    }) == term_count
+                ]
+            
+            # 원본 리스트와 분리
+            if filtered_data is self.data:
+                filtered_data = self.data.copy()
+            
             self.filtered_data = filtered_data
             
             # 시그널 발생
@@ -610,6 +631,22 @@ class DataManager(QObject):
             self.log(f"데이터 필터링 중 오류: {str(e)}", LOG_ERROR)
             return []
     
+    @staticmethod
+    def _normalize_search_terms(search_text: str) -> List[str]:
+        """
+        검색어를 소문자 검색어 목록으로 변환
+        
+        다른 검색어에 포함되는 검색어는 제거한다 (긴 검색어가 있으면 자동으로 만족).
+        이렇게 하면 같은 위치에서 두 검색어가 동시에 일치하는 경우가 없어
+        정규식 한 번의 순회로 모든 검색어 포함 여부를 판단할 수 있다.
+        """
+        terms = sorted(set(search_text.lower().split()), key=len, reverse=True)
+        result: List[str] = []
+        for term in terms:
+            if not any(term in longer for longer in result):
+                result.append(term)
+        return result
+    
     def get_statistics(self) -> Dict[str, str]:
         """
         데이터 통계 정보 반환 (숫자에 3자리마다 콤마)
@@ -168,6 +168,8 @@ class LogWidget(QWidget):
     def _flush_buffer(self):
         """로그 버퍼 플러시"""
         if self._log_buffer:
+            # 버퍼에 쌓인 로그는 한 번의 다시 그리기로 반영
+            self.log_text.setUpdatesEnabled(False)
             try:
                 for message, log_type in self._log_buffer:
                     self._add_log_internal(message, log_type)
@@ -175,6 +177,7 @@ class LogWidget(QWidget):
                 print(f"로그 버퍼 플러시 중 오류: {str(e)}")
             finally:
                 self._log_buffer.clear()
+                self.log_text.setUpdatesEnabled(True)
     
     def add_log(self, message: str, log_type: str = LOG_INFO):
         """로그 메시지 추가 (버퍼링 사용)"""
@@ -247,7 +247,7 @@ class MessageManager(QObject):
                     else:
                         order_header = f"{order_idx}. {order_number}"
                     
-                    block = order_header + "\n" + "\n".join([f"    {prod_idx}) {line}" for prod_idx, line in enumerate(order_details_lines, 1)])
+                    block = order_header + "\n" + "\n".join(f"    {prod_idx}) {line}" for prod_idx, line in enumerate(order_details_lines, 1))
                 else:
                     # 상품이 없는 경우에도 주문번호는 표시
                     block = f"{order_idx}. {order_number}\n    (상품 정보 없음)"
@@ -182,9 +182,24 @@ class StatisticsWidget(QWidget):
         Args:
             stats: 통계 정보 딕셔너리
         """
-        for key, value in stats.items():
-            if key in self.cards:
-                self.cards[key].update_value(value)
+        self.update_many(stats)
+    
+    def update_many(self, stats: Dict[str, int]):
+        """
+        여러 통계를 한 번에 업데이트 (카드별 repaint 없이 마지막에 한 번만 다시 그림)
+        
+        Args:
+            stats: {카드 키: 값} 딕셔너리
+        """
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            for key, value in stats.items():
+                if key in self.cards:
+                    self.cards[key].update_value(value)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
     
     def update_single_statistic(self, key: str, value):
         """
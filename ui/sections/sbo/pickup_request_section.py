@@ -7,13 +7,55 @@ from PySide6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QFrame, QHeaderView,
     QCheckBox, QComboBox, QLineEdit
 )
-from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import Signal, QSize
+from PySide6.QtGui import QFont
 
 from core.types import LogType, MessageStatus
 from ui.sections.base_section import BaseSection
 from ui.theme import get_theme
 
+# 상태별 배경색 (테마 색상 키)
+_STATUS_BG_COLOR_KEYS = {
+    MessageStatus.PENDING.value: "warning",
+    MessageStatus.SENT.value: "success",
+    MessageStatus.FAILED.value: "error",
+}
+
+# 체크박스 셀 가운데 정렬 (래퍼 위젯/레이아웃 없이)
+_CHECKBOX_CENTER_STYLE = "QCheckBox { margin-left: 50%; margin-right: 50%; }"
+
+# 상태별 QColor 캐시 (필요할 때 생성, 테마 변경 시 초기화)
+_STATUS_BG: Dict[str, Any] = {}
+
+
+def _status_bg(status: str):
+    """상태에 해당하는 배경 QColor 반환 (해당 없으면 None)"""
+    color = _STATUS_BG.get(status)
+    if color is None and status not in _STATUS_BG:
+        key = _STATUS_BG_COLOR_KEYS.get(status)
+        color = get_theme().get_qcolor(key) if key else None
+        _STATUS_BG[status] = color
+    return color
+
+
+def _clear_status_bg_cache(*_):
+    """테마 변경 시 상태 배경색 캐시 초기화"""
+    _STATUS_BG.clear()
+
+
+# 테스트용 더미 데이터 (필드 순서는 _DUMMY_FIELDS)
+_DUMMY_FIELDS = (
+    "seller", "pickup_number", "swatch_info", "pickup_date", "pickup_time",
+    "address", "status", "message_status", "processed_at",
+)
+_DUMMY_DATA = (
+    ("판매자A", "PK-2023-001", "면 원단 외 3종", "2023-05-25", "오전 10:00", "서울시 강남구 테헤란로 123", "대기중", "대기중", ""),
+    ("판매자B", "PK-2023-002", "실크 혼방 외 2종", "2023-05-26", "오후 2:00", "서울시 서초구 서초대로 456", "대기중", "대기중", ""),
+    ("판매자C", "PK-2023-003", "울 개버딘 외 1종", "2023-05-27", "오전 11:30", "서울시 성동구 왕십리로 789", "전송완료", "전송완료", "2023-05-27 12:00:00"),
+    ("판매자A", "PK-2023-004", "폴리에스터 트윌 외 4종", "2023-05-28", "오후 3:30", "서울시 강남구 테헤란로 123", "전송실패", "전송실패", "2023-05-28 15:40:00"),
+)
+
+
 class PickupRequestSection(BaseSection):
     """
     SBO 픽업 요청 섹션 - 스와치 픽업 요청 관련 기능
@@ -22,6 +64,9 @@ class PickupRequestSection(BaseSection):
     def __init__(self, parent=None):
         super().__init__("SBO 픽업 요청", parent)
         
+        # 테마가 바뀌면 상태 배경색을 다시 만든다
+        get_theme().theme_changed.connect(_clear_status_bg_cache)
+        
         # 헤더 버튼 추가
         self.refresh_button = self.add_header_button("새로고침", self._on_refresh_clicked)
         self.send_button = self.add_header_button("메시지 전송", self._on_send_clicked, primary=True)
@@ -101,12 +146,7 @@ class PickupRequestSection(BaseSection):
     
     def _load_dummy_data(self):
         """테스트 목적의 더미 데이터 로드"""
-        dummy_data = [
-            {"seller": "판매자A", "pickup_number": "PK-2023-001", "swatch_info": "면 원단 외 3종", "pickup_date": "2023-05-25", "pickup_time": "오전 10:00", "address": "서울시 강남구 테헤란로 123", "status": "대기중", "message_status": "대기중", "processed_at": ""},
-            {"seller": "판매자B", "pickup_number": "PK-2023-002", "swatch_info": "실크 혼방 외 2종", "pickup_date": "2023-05-26", "pickup_time": "오후 2:00", "address": "서울시 서초구 서초대로 456", "status": "대기중", "message_status": "대기중", "processed_at": ""},
-            {"seller": "판매자C", "pickup_number": "PK-2023-003", "swatch_info": "울 개버딘 외 1종", "pickup_date": "2023-05-27", "pickup_time": "오전 11:30", "address": "서울시 성동구 왕십리로 789", "status": "전송완료", "message_status": "전송완료", "processed_at": "2023-05-27 12:00:00"},
-            {"seller": "판매자A", "pickup_number": "PK-2023-004", "swatch_info": "폴리에스터 트윌 외 4종", "pickup_date": "2023-05-28", "pickup_time": "오후 3:30", "address": "서울시 강남구 테헤란로 123", "status": "전송실패", "message_status": "전송실패", "processed_at": "2023-05-28 15:40:00"}
-        ]
+        dummy_data = [dict(zip(_DUMMY_FIELDS, values)) for values in _DUMMY_DATA]
         
         # 테이블 데이터 설정
         self.table.setRowCount(len(dummy_data))
@@ -114,7 +154,8 @@ class PickupRequestSection(BaseSection):
         for row, item in enumerate(dummy_data):
             # 체크박스 셀
             checkbox = QCheckBox()
-            self.table.setCellWidget(row, 0, self._create_checkbox_widget(checkbox))
+            checkbox.setStyleSheet(_CHECKBOX_CENTER_STYLE)
+            self.table.setCellWidget(row, 0, checkbox)
             
             # 나머지 데이터 셀
             self.table.setItem(row, 1, QTableWidgetItem(item["seller"]))
@@ -128,26 +169,13 @@ class PickupRequestSection(BaseSection):
             self.table.setItem(row, 9, QTableWidgetItem(item["processed_at"]))
             
             # 상태에 따른 배경색 설정
-            status_item = self.table.item(row, 7)
-            if item["status"] == "대기중":
-                status_item.setBackground(QColor(get_theme().get_color("warning")))
-            elif item["status"] == MessageStatus.SENT.value:
-                status_item.setBackground(QColor(get_theme().get_color("success")))
-            elif item["status"] == MessageStatus.FAILED.value:
-                status_item.setBackground(QColor(get_theme().get_color("error")))
+            bg = _status_bg(item["status"])
+            if bg:
+                self.table.item(row, 7).setBackground(bg)
         
         # 통계 업데이트
         self.stats_label.setText(f"총 {len(dummy_data)}건")
     
-    def _create_checkbox_widget(self, checkbox):
-        """체크박스를 위한 위젯 생성"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignCenter)
-        layout.addWidget(checkbox)
-        return widget
-    
     def _on_refresh_clicked(self):
         """새로고침 버튼 클릭 이벤트"""
         self.log("픽업 요청 데이터를 새로고침합니다.", LogType.INFO.value)
@@ -156,12 +184,10 @@ class PickupRequestSection(BaseSection):
     def _on_send_clicked(self):
         """메시지 전송 버튼 클릭 이벤트"""
         # 선택된 항목 찾기
-        selected_rows = []
-        for row in range(self.table.rowCount()):
-            checkbox_widget = self.table.cellWidget(row, 0)
-            checkbox = checkbox_widget.findChild(QCheckBox)
-            if checkbox and checkbox.isChecked():
-                selected_rows.append(row)
+        selected_rows = [
+            row for row in range(self.table.rowCount())
+            if (checkbox := self.table.cellWidget(row, 0)) and checkbox.isChecked()
+        ]
         
         if not selected_rows:
             self.log("선택된 항목이 없습니다.", LogType.WARNING.value)
@@ -178,16 +204,14 @@ class PickupRequestSection(BaseSection):
     def _on_select_all_clicked(self):
         """모두 선택 버튼 클릭 이벤트"""
         for row in range(self.table.rowCount()):
-            checkbox_widget = self.table.cellWidget(row, 0)
-            checkbox = checkbox_widget.findChild(QCheckBox)
+            checkbox = self.table.cellWidget(row, 0)
             if checkbox:
                 checkbox.setChecked(True)
     
     def _on_deselect_all_clicked(self):
         """모두 해제 버튼 클릭 이벤트"""
         for row in range(self.table.rowCount()):
-            checkbox_widget = self.table.cellWidget(row, 0)
-            checkbox = checkbox_widget.findChild(QCheckBox)
+            checkbox = self.table.cellWidget(row, 0)
             if checkbox:
                 checkbox.setChecked(False)
     
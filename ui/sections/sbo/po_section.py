@@ -1,13 +1,15 @@
 """
 SBO 스와치 발주 섹션 - 스와치 발주 기능
 """
-from typing import List, Dict, Any
+import sys
+from collections import Counter
+from typing import List, Dict, Any, Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QTableWidget, QTableWidgetItem, QFrame, QHeaderView,
-    QCheckBox, QComboBox, QLineEdit
+    QComboBox, QLineEdit
 )
-from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtCore import Qt, Signal, QSize, QTimer
 from PySide6.QtGui import QFont, QColor
 
 from core.types import LogType, OrderType, SboOperationType
@@ -16,12 +18,33 @@ from ui.components.message_section_mixin import MessageSectionMixin
 from ui.theme import get_theme
 from ui.components.log_widget import LOG_INFO, LOG_SUCCESS, LOG_WARNING, LOG_ERROR
 
+# 테스트용 더미 데이터 (필드 순서는 _DUMMY_FIELDS)
+_DUMMY_FIELDS = (
+    "id", "store_name", "swatch_number", "fabric_name", "color",
+    "quantity", "order_date", "status", "message_status",
+)
+_DUMMY_DATA = (
+    ("1", "패브릭스토어A", "SW001", "코튼 원단", "화이트", 5, "2024-01-15", "pending", "대기중"),
+    ("2", "패브릭스토어B", "SW002", "실크 원단", "블랙", 3, "2024-01-16", "sent", "전송완료"),
+    ("3", "패브릭스토어C", "SW003", "린넨 원단", "베이지", 7, "2024-01-17", "failed", "전송실패"),
+)
+
+
 class SboPoSection(BaseSection, MessageSectionMixin):
     """
     SBO 스와치 발주 섹션 - 스와치 발주 관련 기능
     MessageSectionMixin을 사용하여 공통 기능 활용
     """
     
+    # 값 종류가 적어 intern할 문자열 컬럼
+    _INTERNED_FIELDS = ("store_name", "color", "message_status", "order_date")
+    
+    # 테이블/통계에 표시되는 필드 (이 중 하나라도 바뀌면 다시 그림)
+    _SIGNATURE_FIELDS = (
+        "id", "store_name", "swatch_number", "fabric_name", "color",
+        "quantity", "order_date", "message_status", "urgent",
+    )
+    
     def __init__(self, parent=None):
         super().__init__("SBO 스와치 발주", parent)
         
@@ -33,6 +56,19 @@ class SboPoSection(BaseSection, MessageSectionMixin):
             enable_emergency_stop=True
         )
         
+        # 테이블 행 데이터
+        self._rows: List[Dict] = []
+        self._checked: List[bool] = []
+        self._rows_by_id: Dict[str, Dict] = {}
+        self._row_index_by_id: Dict[str, int] = {}
+        self._status_stats: Counter = Counter()
+        self._last_data_hash: Optional[int] = None
+        
+        # 체크박스 변경 집계 타이머 (여러 변경을 다음 이벤트 루프에서 한 번만 처리)
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.timeout.connect(self._recompute_selection)
+        
         # 콘텐츠 설정
         self.setup_content()
     
@@ -49,17 +85,20 @@ class SboPoSection(BaseSection, MessageSectionMixin):
         ])
         self.table.setSelectionBehavior(QTableWidget.SelectRows)
         self.table.setAlternatingRowColors(True)
+        self.table.itemChanged.connect(self._on_table_item_changed)
         
-        # 테이블 헤더 설정
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # 선택 체크박스
-        header.setSectionResizeMode(1, QHeaderView.Stretch)           # 판매자
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # 스와치 번호
-        header.setSectionResizeMode(3, QHeaderView.Stretch)           # 원단명
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # 색상
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)  # 수량
-        header.setSectionResizeMode(6, QHeaderView.ResizeToContents)  # 발주일
-        header.setSectionResizeMode(7, QHeaderView.ResizeToContents)  # 상태
+        # 테이블 헤더 설정 (대량 로드 후 복원할 수 있도록 보관)
+        self._column_resize_modes = (
+            QHeaderView.ResizeToContents,  # 선택 체크박스
+            QHeaderView.Stretch,           # 판매자
+            QHeaderView.ResizeToContents,  # 스와치 번호
+            QHeaderView.Stretch,           # 원단명
+            QHeaderView.ResizeToContents,  # 색상
+            QHeaderView.ResizeToContents,  # 수량
+            QHeaderView.ResizeToContents,  # 발주일
+            QHeaderView.ResizeToContents,  # 상태
+        )
+        self._apply_column_resize_modes()
         
         self.content_layout.addWidget(self.table)
         
@@ -90,6 +129,12 @@ class SboPoSection(BaseSection, MessageSectionMixin):
         # 테스트 데이터 로드
         self._load_dummy_data()
     
+    def _apply_column_resize_modes(self):
+        """컬럼별 리사이즈 모드 적용"""
+        header = self.table.horizontalHeader()
+        for col, mode in enumerate(self._column_resize_modes):
+            header.setSectionResizeMode(col, mode)
+    
     def _setup_additional_statistics(self):
         """SBO 스와치 발주에 특화된 통계 카드들 설정"""
         self.statistics_widget.add_custom_card("swatch_count", "스와치 건수", "info", 0)
@@ -99,41 +144,7 @@ class SboPoSection(BaseSection, MessageSectionMixin):
     
     def _load_dummy_data(self):
         """더미 데이터 로드"""
-        dummy_data = [
-            {
-                "id": "1",
-                "store_name": "패브릭스토어A",
-                "swatch_number": "SW001",
-                "fabric_name": "코튼 원단",
-                "color": "화이트",
-                "quantity": 5,
-                "order_date": "2024-01-15",
-                "status": "pending",
-                "message_status": "대기중"
-            },
-            {
-                "id": "2", 
-                "store_name": "패브릭스토어B",
-                "swatch_number": "SW002",
-                "fabric_name": "실크 원단",
-                "color": "블랙",
-                "quantity": 3,
-                "order_date": "2024-01-16",
-                "status": "sent",
-                "message_status": "전송완료"
-            },
-            {
-                "id": "3",
-                "store_name": "패브릭스토어C", 
-                "swatch_number": "SW003",
-                "fabric_name": "린넨 원단",
-                "color": "베이지",
-                "quantity": 7,
-                "order_date": "2024-01-17",
-                "status": "failed",
-                "message_status": "전송실패"
-            },
-        ]
+        dummy_data = [dict(zip(_DUMMY_FIELDS, values)) for values in _DUMMY_DATA]
         
         self._update_table_with_data(dummy_data)
         self._update_all_statistics(dummy_data)
@@ -141,76 +152,116 @@ class SboPoSection(BaseSection, MessageSectionMixin):
     
     def _update_table_with_data(self, data: List[Dict]):
         """테이블에 데이터 업데이트"""
-        self.table.setRowCount(len(data))
+        # 대량 삽입 중에는 repaint/시그널/정렬/컬럼 재측정을 모두 멈춘다
+        header = self.table.horizontalHeader()
+        sorting_enabled = self.table.isSortingEnabled()
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        self.table.setSortingEnabled(False)
+        header.setSectionResizeMode(QHeaderView.Interactive)
         
-        for row_idx, item in enumerate(data):
-            # 선택 체크박스
-            checkbox = QCheckBox()
-            checkbox.stateChanged.connect(self._on_checkbox_changed)
-            self.table.setCellWidget(row_idx, 0, checkbox)
-            
-            # 데이터 컬럼들
-            self.table.setItem(row_idx, 1, QTableWidgetItem(item.get("store_name", "")))
-            self.table.setItem(row_idx, 2, QTableWidgetItem(item.get("swatch_number", "")))
-            self.table.setItem(row_idx, 3, QTableWidgetItem(item.get("fabric_name", "")))
-            self.table.setItem(row_idx, 4, QTableWidgetItem(item.get("color", "")))
-            self.table.setItem(row_idx, 5, QTableWidgetItem(str(item.get("quantity", 0))))
-            self.table.setItem(row_idx, 6, QTableWidgetItem(item.get("order_date", "")))
-            self.table.setItem(row_idx, 7, QTableWidgetItem(item.get("message_status", "대기중")))
+        # 반복되는 문자열 컬럼은 같은 객체를 공유하도록 intern
+        for item in data:
+            for key in self._INTERNED_FIELDS:
+                value = item.get(key)
+                if isinstance(value, str):
+                    item[key] = sys.intern(value)
+        
+        # 현재 테이블 데이터 (통계 계산의 기준) 및 행별 체크 상태
+        self._rows = list(data)
+        self._checked = [False] * len(self._rows)
+        
+        # id -> 원본 데이터 / 테이블 행 번호 매핑
+        self._rows_by_id = {str(item.get("id", "")): item for item in data}
+        self._row_index_by_id = {str(item.get("id", "")): row_idx for row_idx, item in enumerate(data)}
+        
+        try:
+            self.table.setRowCount(len(data))
             
-            # 데이터 저장 (나중에 선택된 항목 추출용)
-            for col in range(1, 8):
-                if self.table.item(row_idx, col):
-                    self.table.item(row_idx, col).setData(Qt.UserRole, item)
+            for row_idx, item in enumerate(data):
+                # 선택 체크박스
+                check_item = QTableWidgetItem()
+                check_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+                check_item.setCheckState(Qt.Unchecked)
+                self.table.setItem(row_idx, 0, check_item)
+                
+                # 데이터 컬럼들
+                self.table.setItem(row_idx, 1, QTableWidgetItem(item.get("store_name", "")))
+                self.table.setItem(row_idx, 2, QTableWidgetItem(item.get("swatch_number", "")))
+                self.table.setItem(row_idx, 3, QTableWidgetItem(item.get("fabric_name", "")))
+                self.table.setItem(row_idx, 4, QTableWidgetItem(item.get("color", "")))
+                self.table.setItem(row_idx, 5, QTableWidgetItem(str(item.get("quantity", 0))))
+                self.table.setItem(row_idx, 6, QTableWidgetItem(item.get("order_date", "")))
+                self.table.setItem(row_idx, 7, QTableWidgetItem(item.get("message_status", "대기중")))
+                
+                # 행 식별자 저장 (원본 데이터는 _rows_by_id에서 조회)
+                self.table.item(row_idx, 1).setData(Qt.UserRole, str(item.get("id", "")))
+        finally:
+            self._apply_column_resize_modes()
+            self.table.setSortingEnabled(sorting_enabled)
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
         
         self.stats_label.setText(f"총 {len(data)}건")
     
-    def _update_all_statistics(self, data: List[Dict]):
-        """모든 통계 정보 업데이트"""
+    def _update_all_statistics(self, data: Optional[List[Dict]] = None):
+        """모든 통계 정보 업데이트 (data가 없으면 현재 테이블 데이터 사용)"""
+        if data is None:
+            data = self._rows
         try:
-            # 기본 통계
+            # 기본 통계 + 상태별 통계 (단일 순회)
             total_count = len(data)
-            store_names = set(item.get('store_name', '') for item in data)
-            total_quantity = sum(int(item.get('quantity', 0)) for item in data)
-            urgent_count = sum(1 for item in data if item.get('urgent', False))
-            
-            # 통계 카드 업데이트 - 올바른 메서드명 사용
-            self.statistics_widget.update_single_statistic("swatch_count", total_count)
-            self.statistics_widget.update_single_statistic("store_count", len(store_names))
-            self.statistics_widget.update_single_statistic("total_quantity", total_quantity)
-            self.statistics_widget.update_single_statistic("urgent_count", urgent_count)
-            
-            # 상태별 통계
-            status_stats = {}
+            store_names = set()
+            total_quantity = 0
+            urgent_count = 0
+            status_stats = Counter()
             for item in data:
-                status = item.get('message_status', '대기중')
-                status_stats[status] = status_stats.get(status, 0) + 1
+                store_names.add(item.get('store_name', ''))
+                total_quantity += int(item.get('quantity', 0) or 0)
+                if item.get('urgent', False):
+                    urgent_count += 1
+                status_stats[item.get('message_status', '대기중')] += 1
             
-            # 기본 상태 카드 업데이트 - 올바른 메서드명 사용
-            pending_count = status_stats.get('대기중', 0)
-            sent_count = status_stats.get('전송완료', 0)
-            failed_count = status_stats.get('전송실패', 0)
+            # 상태 변경 시 증분 업데이트를 위해 보관
+            self._status_stats = status_stats
             
-            self.statistics_widget.update_single_statistic("pending", pending_count)
-            self.statistics_widget.update_single_statistic("sent", sent_count)
-            self.statistics_widget.update_single_statistic("failed", failed_count)
-            self.statistics_widget.update_single_statistic("total", total_count)
+            # 통계 카드 일괄 업데이트
+            self.statistics_widget.update_many({
+                "swatch_count": total_count,
+                "store_count": len(store_names),
+                "total_quantity": total_quantity,
+                "urgent_count": urgent_count,
+                "pending": status_stats.get('대기중', 0),
+                "sent": status_stats.get('전송완료', 0),
+                "failed": status_stats.get('전송실패', 0),
+                "total": total_count,
+            })
             
         except Exception as e:
             self.log(f"통계 업데이트 중 오류: {str(e)}", LOG_ERROR)
     
+    def _update_status_statistics(self):
+        """보관된 상태별 통계로 상태 카드만 업데이트"""
+        self.statistics_widget.update_many({
+            "pending": self._status_stats.get('대기중', 0),
+            "sent": self._status_stats.get('전송완료', 0),
+            "failed": self._status_stats.get('전송실패', 0),
+        })
+    
+    def _on_table_item_changed(self, item: QTableWidgetItem):
+        """선택 컬럼 체크 상태 변경 반영"""
+        if item.column() != 0:
+            return
+        self._checked[item.row()] = item.checkState() == Qt.Checked
+        self._on_checkbox_changed()
+    
     def _on_checkbox_changed(self):
-        """체크박스 변경 시 선택된 항목 업데이트"""
-        selected_items = []
-        for row in range(self.table.rowCount()):
-            checkbox = self.table.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked():
-                # 첫 번째 데이터 컬럼에서 저장된 원본 데이터 추출
-                item_widget = self.table.item(row, 1)
-                if item_widget:
-                    item_data = item_widget.data(Qt.UserRole)
-                    if item_data:
-                        selected_items.append(item_data)
+        """체크박스 변경 시 선택 항목 재계산 예약"""
+        self._selection_timer.start(0)
+    
+    def _recompute_selection(self):
+        """선택된 항목 업데이트"""
+        selected_items = [item for item, checked in zip(self._rows, self._checked) if checked]
         
         self._selected_items = selected_items
         
@@ -221,19 +272,28 @@ class SboPoSection(BaseSection, MessageSectionMixin):
         
         self.log(f"선택된 항목: {len(selected_items)}건", LogType.DEBUG.value)
     
+    def _set_all_checked(self, checked: bool):
+        """모든 행의 체크 상태를 한 번에 변경"""
+        state = Qt.Checked if checked else Qt.Unchecked
+        
+        # 행별 itemChanged 처리 없이 상태만 바꾸고 선택은 마지막에 한 번 계산
+        self.table.blockSignals(True)
+        try:
+            for row in range(self.table.rowCount()):
+                self.table.item(row, 0).setCheckState(state)
+        finally:
+            self.table.blockSignals(False)
+        
+        self._checked = [checked] * len(self._rows)
+        self._recompute_selection()
+    
     def _on_select_all_clicked(self):
         """모두 선택 버튼 클릭"""
-        for row in range(self.table.rowCount()):
-            checkbox = self.table.cellWidget(row, 0)
-            if checkbox:
-                checkbox.setChecked(True)
+        self._set_all_checked(True)
     
     def _on_deselect_all_clicked(self):
         """모두 해제 버튼 클릭"""
-        for row in range(self.table.rowCount()):
-            checkbox = self.table.cellWidget(row, 0)
-            if checkbox:
-                checkbox.setChecked(False)
+        self._set_all_checked(False)
     
     # MessageSectionMixin 인터페이스 구현
     def _convert_item_to_dict(self, item) -> Dict[str, Any]:
@@ -245,34 +305,50 @@ class SboPoSection(BaseSection, MessageSectionMixin):
     
     def _update_item_status(self, item_ids: List[int], status: str, set_processed_time: bool = False):
         """항목 상태 업데이트 콜백"""
-        # 테이블에서 해당 항목들의 상태 업데이트
-        for row in range(self.table.rowCount()):
-            item_widget = self.table.item(row, 1)
-            if item_widget:
-                item_data = item_widget.data(Qt.UserRole)
-                if item_data and str(item_data.get('id', '')) in [str(id) for id in item_ids]:
-                    # 상태 컬럼 업데이트
-                    status_item = self.table.item(row, 7)
-                    if status_item:
-                        status_item.setText(status)
-                    
-                    # 원본 데이터도 업데이트
-                    item_data['message_status'] = status
-                    item_widget.setData(Qt.UserRole, item_data)
+        # 테이블에서 해당 항목들의 상태 업데이트 (id 매핑으로 직접 조회)
+        target_ids = {str(item_id) for item_id in item_ids}
+        for sid in target_ids:
+            item_data = self._rows_by_id.get(sid)
+            if item_data is None:
+                continue
+            
+            # 상태 컬럼 업데이트
+            status_item = self.table.item(self._row_index_by_id[sid], 7)
+            if status_item:
+                status_item.setText(status)
+            
+            # 상태별 통계 증분 반영
+            old_status = item_data.get('message_status', '대기중')
+            if old_status != status:
+                self._status_stats[old_status] -= 1
+                self._status_stats[status] += 1
+            
+            # 원본 데이터도 업데이트
+            item_data['message_status'] = status
         
-        # 통계 재계산
-        current_data = []
-        for row in range(self.table.rowCount()):
-            item_widget = self.table.item(row, 1)
-            if item_widget:
-                item_data = item_widget.data(Qt.UserRole)
-                if item_data:
-                    current_data.append(item_data)
+        # 표시 내용이 바뀌었으므로 다음 로드는 항상 다시 그린다
+        self._last_data_hash = None
         
-        self._update_all_statistics(current_data)
+        # 상태 관련 카드만 갱신
+        self._update_status_statistics()
+    
+    @classmethod
+    def _data_signature(cls, data: List[Dict]) -> int:
+        """테이블 표시 내용 변경 여부 판단용 해시"""
+        return hash(tuple(
+            tuple(item.get(key) for key in cls._SIGNATURE_FIELDS)
+            for item in data
+        ))
     
     def _on_data_loaded(self, data):
         """데이터 로드 완료 이벤트"""
+        # 이전과 동일한 데이터면 테이블/통계 재구성 생략
+        data_hash = self._data_signature(data)
+        if data_hash == self._last_data_hash:
+            self.log(f"SBO 스와치 발주 데이터 변경 없음 ({len(data)}건)", LogType.DEBUG.value)
+            return
+        self._last_data_hash = data_hash
+        
         self._update_table_with_data(data)
         self._update_all_statistics(data)
         self.log(f"SBO 스와치 발주 데이터 {len(data)}건이 로드되었습니다.", LOG_SUCCESS)
@@ -1,17 +1,18 @@
 """
 설정 섹션 - 애플리케이션 설정 관리
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QFormLayout, QLineEdit, QCheckBox, QComboBox, QSpinBox,
     QTabWidget, QGroupBox, QSpacerItem, QSizePolicy, QFileDialog,
-    QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox
+    QTableView, QHeaderView, QMessageBox, QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtCore import Qt, Signal, QSize, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont, QColor
 import os
 import json
+import traceback
 
 from core.types import LogType, ThemeMode, SectionType
 from ui.sections.base_section import BaseSection
@@ -20,22 +21,125 @@ from core.config import ConfigManager
 from core.constants import ConfigKey, SpreadsheetConfigKey, SECTION_SPREADSHEET_MAPPING
 from ui.components.log_widget import LOG_INFO, LOG_DEBUG, LOG_WARNING, LOG_ERROR, LOG_SUCCESS
 
+class SheetSettingsModel(QAbstractTableModel):
+    """
+    기능별 스프레드시트 설정 테이블 모델 (기능, 스프레드시트 URL, 시트 이름)
+    """
+    
+    HEADERS = ("기능", "스프레드시트 URL", "시트 이름")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[List[str]] = []
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self._rows[index.row()][index.column()]
+        return None
+    
+    def setData(self, index: QModelIndex, value, role=Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole or index.column() == 0:
+            return False
+        self._rows[index.row()][index.column()] = "" if value is None else str(value)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() != 0:
+            flags |= Qt.ItemIsEditable
+        return flags
+    
+    def set_rows(self, rows: List[List[str]]):
+        """전체 행 교체"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def row_values(self, row: int) -> List[str]:
+        """행 값 반환"""
+        return self._rows[row]
+    
+    def snapshot(self) -> List[List[str]]:
+        """현재 모든 행의 복사본"""
+        return [row_values[:] for row_values in self._rows]
+    
+    def set_column(self, column: int, value: str):
+        """한 컬럼 전체를 같은 값으로 변경"""
+        self.fill_columns({column: value})
+    
+    def fill_columns(self, values: Dict[int, str]):
+        """여러 컬럼 전체를 각각 같은 값으로 변경 (dataChanged 한 번)"""
+        if not self._rows or not values:
+            return
+        for row_values in self._rows:
+            for column, value in values.items():
+                row_values[column] = value
+        self.dataChanged.emit(
+            self.index(0, min(values)), self.index(len(self._rows) - 1, max(values)),
+            [Qt.DisplayRole, Qt.EditRole]
+        )
+
+
 class SettingsSection(BaseSection):
     """
     설정 섹션 - 애플리케이션 설정 관리
     """
     
+    # 탭 인덱스
+    _TAB_GENERAL = 0
+    _TAB_KAKAO = 1
+    _TAB_SPREADSHEET = 2
+    _TAB_SCRAPING = 3
+    
     def __init__(self, parent=None):
         super().__init__("설정", parent)
         
-        # 설정 관리자 인스턴스 가져오기
+        # 설정 관리자 / 테마 인스턴스 가져오기
         self.config_manager = ConfigManager()
+        self._theme = get_theme()
         
         # 저장 버튼 추가
         self.save_button = self.add_header_button("저장", self._on_save_clicked, primary=True)
         
-        # 설정 로드 플래그
-        self._settings_loaded = False
+        # 기능별 스프레드시트 설정 행 정의 (이름, URL 키, 시트 키, 기본 시트 이름)
+        self._section_rows = tuple(
+            (d["name"], d["url_key"], d["sheet_key"], d["name"].split(" ")[-1])
+            for d in SECTION_SPREADSHEET_MAPPING.values()
+        )
+        
+        # 마지막으로 화면에 반영한 설정 버전 (ConfigManager.version)
+        self._loaded_version = -1
+        
+        # 저장되지 않은 변경 사항 여부
+        self._dirty = False
+        
+        # 파일 대화상자에서 마지막으로 사용한 디렉토리
+        self._last_browse_dir = ""
+        
+        # 재사용 메시지 박스
+        self._info_box = self._create_message_box(QMessageBox.Information, QMessageBox.Ok)
+        self._error_box = self._create_message_box(QMessageBox.Critical, QMessageBox.Ok)
+        self._question_box = self._create_message_box(
+            QMessageBox.Question, QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+        )
+        
+        # 설정 스냅샷 캐시 (ConfigManager.version 기준)
+        self._config_snapshot: Dict[str, Any] = {}
+        self._config_snapshot_version = -1
         
         # 콘텐츠 설정
         self.setup_content()
@@ -43,9 +147,143 @@ class SettingsSection(BaseSection):
     def setup_content(self):
         """콘텐츠 설정"""
         # 탭 위젯 생성
-        tab_widget = QTabWidget()
+        self.tab_widget = QTabWidget()
+        
+        # 일반 설정 탭은 바로 생성하고, 나머지 탭은 처음 선택될 때 생성
+        self.tab_widget.addTab(self._build_general_tab(), "일반 설정")
+        
+        self._tab_pages: Dict[int, QWidget] = {}
+        self._tab_builders: Dict[int, Callable[[], QWidget]] = {}
+        for index, title, builder in (
+            (self._TAB_KAKAO, "카카오톡 설정", self._build_kakao_tab),
+            (self._TAB_SPREADSHEET, "스프레드시트 설정", self._build_spreadsheet_tab),
+            (self._TAB_SCRAPING, "스크래핑 URL 설정", self._build_scraping_tab),
+        ):
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self._tab_pages[index] = page
+            self._tab_builders[index] = builder
+            self.tab_widget.addTab(page, title)
+        
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        
+        # 저장 항목 정의
+        self._save_spec = self._build_save_spec()
+        
+        # 레이아웃에 탭 위젯 추가
+        self.content_layout.addWidget(self.tab_widget)
+    
+    def _build_save_spec(self) -> List[tuple]:
+        """저장 항목 정의 (탭 인덱스, 설정 키, 값 읽기 함수, 로그 라벨)"""
+        return [
+            # 일반 설정
+            (self._TAB_GENERAL, ConfigKey.UI_THEME.value, lambda: self.theme_combo.currentData(), "UI 테마"),
+            (self._TAB_GENERAL, ConfigKey.LOG_LEVEL.value, lambda: self.log_level_combo.currentData(), "로그 레벨"),
+            (self._TAB_GENERAL, ConfigKey.SAVE_LOGS.value, lambda: self.save_log_check.isChecked(), "로그 저장"),
+            (self._TAB_GENERAL, ConfigKey.LOGS_PATH.value, lambda: self.log_path_edit.text(), "로그 경로"),
+            # 카카오톡 설정
+            (self._TAB_KAKAO, ConfigKey.KAKAO_PATH.value, lambda: self.kakao_path_edit.text(), "카카오톡 경로"),
+            (self._TAB_KAKAO, ConfigKey.AUTO_START_KAKAO.value, lambda: self.auto_start_kakao.isChecked(), "자동시작"),
+            (self._TAB_KAKAO, ConfigKey.MESSAGE_DELAY.value, lambda: self.message_delay.value(), "메시지 딜레이"),
+            # 스크래핑 URL 설정
+            (self._TAB_SCRAPING, ConfigKey.SWATCHON_ADMIN_URL.value, lambda: self.swatchon_admin_url.text(), "SwatchOn Admin URL"),
+            (self._TAB_SCRAPING, ConfigKey.RECEIVE_SCRAPING_URL.value, lambda: self.receive_scraping_url.text(), "스크래핑 URL"),
+            # 스프레드시트 설정
+            (self._TAB_SPREADSHEET, ConfigKey.API_LIMIT.value, lambda: self.api_limit.value(), "API 제한"),
+            (self._TAB_SPREADSHEET, SpreadsheetConfigKey.ADDRESS_BOOK_URL.value,
+             lambda: self.address_spreadsheet_url.text().strip(), "주소록 URL"),
+            (self._TAB_SPREADSHEET, SpreadsheetConfigKey.ADDRESS_BOOK_SHEET.value,
+             lambda: self.address_sheet_name.text().strip(), "주소록 시트"),
+        ]
+    
+    def _validate_credentials_path(self, credentials: str) -> Optional[str]:
+        """
+        Google API 자격 증명 파일 경로 검증
+        
+        Returns:
+            Optional[str]: 절대 경로로 변환된 경로 (빈 값이면 빈 문자열), 오류 시 None
+        """
+        if not credentials:
+            return credentials
+        
+        # 절대 경로로 변환
+        if not os.path.isabs(credentials):
+            exe_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            credentials = os.path.join(exe_dir, credentials)
+        
+        # 파일 존재 여부 확인
+        if not os.path.exists(credentials):
+            self.log(f"Google API 자격 증명 파일을 찾을 수 없습니다: {credentials}", LOG_ERROR)
+            return None
+        
+        # JSON 형식 검증
+        try:
+            with open(credentials, 'r', encoding='utf-8') as f:
+                json.load(f)
+        except json.JSONDecodeError:
+            self.log(f"Google API 자격 증명 파일이 올바른 JSON 형식이 아닙니다: {credentials}", LOG_ERROR)
+            return None
+        except Exception as e:
+            self.log(f"Google API 자격 증명 파일을 읽을 수 없습니다: {str(e)}", LOG_ERROR)
+            return None
+        
+        return credentials
+    
+    def _create_message_box(self, icon, buttons, default_button=None) -> QMessageBox:
+        """재사용할 메시지 박스 생성"""
+        box = QMessageBox(self)
+        box.setIcon(icon)
+        box.setStandardButtons(buttons)
+        if default_button is not None:
+            box.setDefaultButton(default_button)
+        return box
+    
+    def _show_message_box(self, box: QMessageBox, title: str, text: str) -> int:
+        """메시지 박스 내용을 바꿔 표시하고 눌린 버튼 반환"""
+        box.setWindowTitle(title)
+        box.setText(text)
+        return box.exec()
+    
+    def _mark_dirty(self, *_):
+        """설정 변경 표시"""
+        self._dirty = True
+    
+    def _watch_for_changes(self, *widgets: QWidget):
+        """입력 위젯의 변경 시그널을 변경 표시에 연결"""
+        for widget in widgets:
+            if isinstance(widget, QComboBox):
+                widget.currentIndexChanged.connect(self._mark_dirty)
+            elif isinstance(widget, QLineEdit):
+                widget.textChanged.connect(self._mark_dirty)
+            elif isinstance(widget, QCheckBox):
+                widget.toggled.connect(self._mark_dirty)
+            elif isinstance(widget, QSpinBox):
+                widget.valueChanged.connect(self._mark_dirty)
+    
+    def _ensure_tab_built(self, index: int):
+        """탭이 처음 선택되면 실제 내용을 생성해 자리표시 위젯에 넣는다"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        self._tab_pages[index].layout().addWidget(builder())
+    
+    def _is_tab_built(self, index: int) -> bool:
+        """탭 내용이 생성되었는지 여부"""
+        return index not in self._tab_builders
+    
+    def _settings_snapshot(self) -> Dict[str, Any]:
+        """설정 값 스냅샷 (설정이 바뀌지 않았으면 이전 스냅샷 재사용)"""
+        version = self.config_manager.version
+        if version != self._config_snapshot_version:
+            self._config_snapshot = self.config_manager.get_all()
+            self._config_snapshot_version = version
+        return self._config_snapshot
+    
+    def _build_general_tab(self) -> QWidget:
+        """일반 설정 탭 생성"""
+        cfg = self._settings_snapshot()
         
-        # 일반 설정 탭
         general_tab = QWidget()
         general_layout = QFormLayout(general_tab)
         general_layout.setContentsMargins(16, 16, 16, 16)
@@ -57,11 +295,8 @@ class SettingsSection(BaseSection):
         self.theme_combo.addItem("라이트 모드", ThemeMode.LIGHT.value)
         self.theme_combo.addItem("다크 모드", ThemeMode.DARK.value)
         
-        current_theme = get_theme().get_theme_name()
-        for i in range(self.theme_combo.count()):
-            if self.theme_combo.itemData(i) == current_theme:
-                self.theme_combo.setCurrentIndex(i)
-                break
+        index = self.theme_combo.findData(self._theme.get_theme_name())
+        self.theme_combo.setCurrentIndex(index if index >= 0 else 0)
         
         general_layout.addRow("테마:", self.theme_combo)
         
@@ -73,24 +308,21 @@ class SettingsSection(BaseSection):
         self.log_level_combo.addItem("오류", LogType.ERROR.value)
         
         # 현재 로그 레벨 설정
-        current_log_level = self.config_manager.get(ConfigKey.LOG_LEVEL, LogType.INFO.value)
-        for i in range(self.log_level_combo.count()):
-            if self.log_level_combo.itemData(i) == current_log_level:
-                self.log_level_combo.setCurrentIndex(i)
-                break
+        index = self.log_level_combo.findData(cfg.get(ConfigKey.LOG_LEVEL.value, LogType.INFO.value))
+        self.log_level_combo.setCurrentIndex(index if index >= 0 else 0)
         
         general_layout.addRow("로그 레벨:", self.log_level_combo)
         
         # 로그 파일 저장 옵션
         self.save_log_check = QCheckBox("로그 파일 저장")
-        self.save_log_check.setChecked(self.config_manager.get(ConfigKey.SAVE_LOGS, True))
+        self.save_log_check.setChecked(cfg.get(ConfigKey.SAVE_LOGS.value, True))
         
         general_layout.addRow("", self.save_log_check)
         
         # 로그 파일 경로
         self.log_path_edit = QLineEdit()
         self.log_path_edit.setPlaceholderText("로그 파일 경로를 입력하세요")
-        self.log_path_edit.setText(self.config_manager.get(ConfigKey.LOGS_PATH, "logs"))
+        self.log_path_edit.setText(cfg.get(ConfigKey.LOGS_PATH.value, "logs"))
         
         log_path_layout = QHBoxLayout()
         log_path_layout.setSpacing(8)
@@ -106,7 +338,16 @@ class SettingsSection(BaseSection):
         # 여백 추가
         general_layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
         
-        # 카카오톡 설정 탭
+        self._watch_for_changes(
+            self.theme_combo, self.log_level_combo, self.save_log_check, self.log_path_edit
+        )
+        
+        return general_tab
+    
+    def _build_kakao_tab(self) -> QWidget:
+        """카카오톡 설정 탭 생성"""
+        cfg = self._settings_snapshot()
+        
         kakao_tab = QWidget()
         kakao_layout = QFormLayout(kakao_tab)
         kakao_layout.setContentsMargins(16, 16, 16, 16)
@@ -115,7 +356,7 @@ class SettingsSection(BaseSection):
         # 카카오톡 경로
         self.kakao_path_edit = QLineEdit()
         self.kakao_path_edit.setPlaceholderText("카카오톡 실행 파일 경로")
-        self.kakao_path_edit.setText(self.config_manager.get(ConfigKey.KAKAO_PATH, ""))
+        self.kakao_path_edit.setText(cfg.get(ConfigKey.KAKAO_PATH.value, ""))
         
         kakao_path_layout = QHBoxLayout()
         kakao_path_layout.setSpacing(8)
@@ -130,14 +371,14 @@ class SettingsSection(BaseSection):
         
         # 자동 실행 설정
         self.auto_start_kakao = QCheckBox("프로그램 시작 시 카카오톡 자동 실행")
-        self.auto_start_kakao.setChecked(self.config_manager.get(ConfigKey.AUTO_START_KAKAO, False))
+        self.auto_start_kakao.setChecked(cfg.get(ConfigKey.AUTO_START_KAKAO.value, False))
         kakao_layout.addRow("", self.auto_start_kakao)
         
         # 메시지 딜레이 설정
         self.message_delay = QSpinBox()
         self.message_delay.setMinimum(100)
         self.message_delay.setMaximum(5000)
-        self.message_delay.setValue(self.config_manager.get(ConfigKey.MESSAGE_DELAY, 1000))
+        self.message_delay.setValue(cfg.get(ConfigKey.MESSAGE_DELAY.value, 1000))
         self.message_delay.setSuffix(" ms")
         
         kakao_layout.addRow("메시지 딜레이:", self.message_delay)
@@ -145,7 +386,14 @@ class SettingsSection(BaseSection):
         # 여백 추가
         kakao_layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
         
-        # 스프레드시트 설정 탭
+        self._watch_for_changes(self.kakao_path_edit, self.auto_start_kakao, self.message_delay)
+        
+        return kakao_tab
+    
+    def _build_spreadsheet_tab(self) -> QWidget:
+        """스프레드시트 설정 탭 생성"""
+        cfg = self._settings_snapshot()
+        
         spreadsheet_tab = QWidget()
         spreadsheet_layout = QVBoxLayout(spreadsheet_tab)
         spreadsheet_layout.setContentsMargins(16, 16, 16, 16)
@@ -158,7 +406,7 @@ class SettingsSection(BaseSection):
         # 자격 증명 파일 경로
         self.credentials_path_edit = QLineEdit()
         self.credentials_path_edit.setPlaceholderText("credentials.json 파일 경로")
-        credentials_path = self.config_manager.get(ConfigKey.GOOGLE_CREDENTIALS.value, "")
+        credentials_path = cfg.get(ConfigKey.GOOGLE_CREDENTIALS.value, "")
         if credentials_path:
             # 절대 경로로 변환
             if not os.path.isabs(credentials_path):
@@ -181,44 +429,13 @@ class SettingsSection(BaseSection):
         self.api_limit = QSpinBox()
         self.api_limit.setMinimum(10)
         self.api_limit.setMaximum(1000)
-        self.api_limit.setValue(self.config_manager.get(ConfigKey.API_LIMIT, 60))
+        self.api_limit.setValue(cfg.get(ConfigKey.API_LIMIT.value, 60))
         self.api_limit.setSuffix(" 요청/분")
         
         credentials_layout.addRow("API 요청 제한:", self.api_limit)
         
         spreadsheet_layout.addWidget(credentials_group)
         
-        # 스크래핑 URL 설정 탭
-        scraping_tab = QWidget()
-        scraping_layout = QFormLayout(scraping_tab)
-        scraping_layout.setContentsMargins(16, 16, 16, 16)
-        scraping_layout.setSpacing(12)
-        
-        # SwatchOn 관리자 페이지 URL
-        self.swatchon_admin_url = QLineEdit()
-        self.swatchon_admin_url.setPlaceholderText("SwatchOn Admin 페이지 기본 URL")
-        self.swatchon_admin_url.setText(
-            self.config_manager.get(ConfigKey.SWATCHON_ADMIN_URL, "https://admin.swatchon.me")
-        )
-        scraping_layout.addRow("Admin 페이지 URL:", self.swatchon_admin_url)
-        
-        # 스크래핑 URL (입고 페이지 URL, 모든 기능 공통)
-        self.receive_scraping_url = QLineEdit()
-        self.receive_scraping_url.setPlaceholderText("스크래핑 페이지 URL을 입력하세요")
-        self.receive_scraping_url.setText(
-            self.config_manager.get(ConfigKey.RECEIVE_SCRAPING_URL, 
-                                   self.config_manager.get(ConfigKey.SWATCHON_ADMIN_URL, "https://admin.swatchon.me") + "/purchase_products/receive_index")
-        )
-        scraping_layout.addRow("스크래핑 URL:", self.receive_scraping_url)
-        
-        # 설명 추가
-        url_help_label = QLabel("※ 모든 출고 요청/확인 및 입고 기능은 동일한 스크래핑 URL을 사용합니다.")
-        url_help_label.setStyleSheet("color: gray;")
-        scraping_layout.addRow("", url_help_label)
-        
-        # 여백 추가
-        scraping_layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
-        
         # 주소록 스프레드시트 설정 그룹
         address_group = QGroupBox("주소록 스프레드시트 설정 (모든 기능 공통)")
         address_layout = QFormLayout(address_group)
@@ -226,13 +443,13 @@ class SettingsSection(BaseSection):
         # 주소록 스프레드시트 URL
         self.address_spreadsheet_url = QLineEdit()
         self.address_spreadsheet_url.setPlaceholderText("주소록 스프레드시트 URL을 입력하세요")
-        self.address_spreadsheet_url.setText(self.config_manager.get(SpreadsheetConfigKey.ADDRESS_BOOK_URL.value, ""))
+        self.address_spreadsheet_url.setText(cfg.get(SpreadsheetConfigKey.ADDRESS_BOOK_URL.value, ""))
         address_layout.addRow("스프레드시트 URL:", self.address_spreadsheet_url)
         
         # 주소록 시트 이름
         self.address_sheet_name = QLineEdit()
         self.address_sheet_name.setPlaceholderText("주소록 시트 이름을 입력하세요")
-        self.address_sheet_name.setText(self.config_manager.get(SpreadsheetConfigKey.ADDRESS_BOOK_SHEET.value, "주소록"))
+        self.address_sheet_name.setText(cfg.get(SpreadsheetConfigKey.ADDRESS_BOOK_SHEET.value, "주소록"))
         address_layout.addRow("시트 이름:", self.address_sheet_name)
         
         # 테스트 버튼
@@ -247,9 +464,10 @@ class SettingsSection(BaseSection):
         sheet_layout = QVBoxLayout(sheet_settings_group)
         
         # 테이블 위젯
-        self.sheet_table = QTableWidget()
-        self.sheet_table.setColumnCount(3)
-        self.sheet_table.setHorizontalHeaderLabels(["기능", "스프레드시트 URL", "시트 이름"])
+        self.sheet_model = SheetSettingsModel(self)
+        self.sheet_table = QTableView()
+        self.sheet_table.setModel(self.sheet_model)
+        self.sheet_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.sheet_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.sheet_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.sheet_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
@@ -295,67 +513,108 @@ class SettingsSection(BaseSection):
         # 여백 추가
         spreadsheet_layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
         
-        # 탭 추가
-        tab_widget.addTab(general_tab, "일반 설정")
-        tab_widget.addTab(kakao_tab, "카카오톡 설정")
-        tab_widget.addTab(spreadsheet_tab, "스프레드시트 설정")
-        tab_widget.addTab(scraping_tab, "스크래핑 URL 설정")
-        
-        # 레이아웃에 탭 위젯 추가
-        self.content_layout.addWidget(tab_widget)
-        
         # 설정 데이터 로드
         self._load_settings()
+        
+        self._watch_for_changes(
+            self.credentials_path_edit, self.api_limit,
+            self.address_spreadsheet_url, self.address_sheet_name
+        )
+        self.sheet_model.dataChanged.connect(self._mark_dirty)
+        
+        return spreadsheet_tab
+    
+    def _build_scraping_tab(self) -> QWidget:
+        """스크래핑 URL 설정 탭 생성"""
+        cfg = self._settings_snapshot()
+        
+        scraping_tab = QWidget()
+        scraping_layout = QFormLayout(scraping_tab)
+        scraping_layout.setContentsMargins(16, 16, 16, 16)
+        scraping_layout.setSpacing(12)
+        
+        # SwatchOn 관리자 페이지 URL
+        self.swatchon_admin_url = QLineEdit()
+        self.swatchon_admin_url.setPlaceholderText("SwatchOn Admin 페이지 기본 URL")
+        admin_url = cfg.get(ConfigKey.SWATCHON_ADMIN_URL.value, "https://admin.swatchon.me")
+        self.swatchon_admin_url.setText(admin_url)
+        scraping_layout.addRow("Admin 페이지 URL:", self.swatchon_admin_url)
+        
+        # 스크래핑 URL (입고 페이지 URL, 모든 기능 공통)
+        self.receive_scraping_url = QLineEdit()
+        self.receive_scraping_url.setPlaceholderText("스크래핑 페이지 URL을 입력하세요")
+        self.receive_scraping_url.setText(
+            cfg.get(ConfigKey.RECEIVE_SCRAPING_URL.value, admin_url + "/purchase_products/receive_index")
+        )
+        scraping_layout.addRow("스크래핑 URL:", self.receive_scraping_url)
+        
+        # 설명 추가
+        url_help_label = QLabel("※ 모든 출고 요청/확인 및 입고 기능은 동일한 스크래핑 URL을 사용합니다.")
+        url_help_label.setStyleSheet("color: gray;")
+        scraping_layout.addRow("", url_help_label)
+        
+        # 여백 추가
+        scraping_layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
+        
+        self._watch_for_changes(self.swatchon_admin_url, self.receive_scraping_url)
+        
+        return scraping_tab
     
     def _load_settings(self):
         """설정 데이터 로드"""
         # 기능별 스프레드시트 설정 로드
         self._load_sheet_settings()
+        self._loaded_version = self.config_manager.version
     
     def _load_sheet_settings(self):
         """기능별 스프레드시트 설정 로드"""
-        # 테이블 크기 설정
-        self.sheet_table.setRowCount(len(SECTION_SPREADSHEET_MAPPING))
-        
-        # 각 행에 데이터 설정
-        row = 0
-        for section_key, section_data in SECTION_SPREADSHEET_MAPPING.items():
-            # 기능 이름
-            self.sheet_table.setItem(row, 0, QTableWidgetItem(section_data["name"]))
-            
-            # 스프레드시트 URL - url_key 값을 문자열로 처리
-            url_key = section_data["url_key"]
-            url = self.config_manager.get(url_key, "")
-            url_item = QTableWidgetItem(url)
-            self.sheet_table.setItem(row, 1, url_item)
-            
-            # 시트 이름 - sheet_key 값을 문자열로 처리
-            sheet_key = section_data["sheet_key"]
-            sheet_name = self.config_manager.get(sheet_key, section_data["name"].split(" ")[-1])
-            self.sheet_table.setItem(row, 2, QTableWidgetItem(sheet_name))
-            
-            row += 1
+        cfg_get = self._settings_snapshot().get
+        
+        # 각 행 데이터 (기능 이름, 스프레드시트 URL, 시트 이름)을 한 번에 모델에 설정
+        self.sheet_model.set_rows([
+            [name, cfg_get(url_key, ""), cfg_get(sheet_key, default_sheet)]
+            for name, url_key, sheet_key, default_sheet in self._section_rows
+        ])
+    
+    def _browse_start_dir(self, current_path: str, is_dir: bool = False) -> str:
+        """파일 대화상자 시작 디렉토리 (현재 설정 경로 > 마지막 사용 경로 > 홈)"""
+        if current_path:
+            directory = current_path if is_dir else os.path.dirname(current_path)
+            if directory and os.path.isdir(directory):
+                return directory
+        return self._last_browse_dir or os.path.expanduser("~")
+    
+    def _remember_browse_dir(self, path: str, is_dir: bool = False):
+        """마지막으로 사용한 디렉토리 기억"""
+        self._last_browse_dir = path if is_dir else os.path.dirname(path)
     
     def _on_log_path_browse(self):
         """로그 파일 경로 선택 대화상자"""
-        directory = QFileDialog.getExistingDirectory(self, "로그 폴더 선택")
+        directory = QFileDialog.getExistingDirectory(
+            self, "로그 폴더 선택", self._browse_start_dir(self.log_path_edit.text(), is_dir=True)
+        )
         if directory:
+            self._remember_browse_dir(directory, is_dir=True)
             self.log_path_edit.setText(directory)
     
     def _on_kakao_path_browse(self):
         """카카오톡 실행 파일 선택 대화상자"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "카카오톡 실행 파일 선택", "", "실행 파일 (*.exe)"
+            self, "카카오톡 실행 파일 선택",
+            self._browse_start_dir(self.kakao_path_edit.text()), "실행 파일 (*.exe)"
         )
         if file_path:
+            self._remember_browse_dir(file_path)
             self.kakao_path_edit.setText(file_path)
     
     def _on_credentials_path_browse(self):
         """자격 증명 파일 선택 대화상자"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "자격 증명 파일 선택", "", "JSON 파일 (*.json)"
+            self, "자격 증명 파일 선택",
+            self._browse_start_dir(self.credentials_path_edit.text()), "JSON 파일 (*.json)"
         )
         if file_path:
+            self._remember_browse_dir(file_path)
             self.credentials_path_edit.setText(file_path)
     
     def _on_address_test(self):
@@ -379,42 +638,34 @@ class SettingsSection(BaseSection):
     def _on_copy_sheet_settings(self):
         """선택한 시트 설정을 다른 행으로 복사"""
         # 현재 선택된 행
-        selected_rows = self.sheet_table.selectedIndexes()
+        selected_rows = self.sheet_table.selectionModel().selectedRows()
         if not selected_rows:
             self.log("복사할 설정을 선택해주세요.", LOG_WARNING)
             return
         
         # 선택된 행에서 URL과 시트 이름 가져오기
         row = selected_rows[0].row()
-        spreadsheet_url = self.sheet_table.item(row, 1).text()
-        sheet_name = self.sheet_table.item(row, 2).text()
+        _, spreadsheet_url, sheet_name = self.sheet_model.row_values(row)
         
         # 모든 행에 설정 복사할지 확인
         message = f"선택한 설정을 모든 기능에 복사하시겠습니까?\n\nURL: {spreadsheet_url}\n시트: {sheet_name}"
-        reply = QMessageBox.question(self, "설정 복사 확인", message, 
-                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-        
-        if reply == QMessageBox.Yes:
+        if self._show_message_box(self._question_box, "설정 복사 확인", message) == QMessageBox.Yes:
             # 모든 행에 설정 복사
-            for row in range(self.sheet_table.rowCount()):
-                self.sheet_table.item(row, 1).setText(spreadsheet_url)
-                self.sheet_table.item(row, 2).setText(sheet_name)
+            self.sheet_model.fill_columns({1: spreadsheet_url, 2: sheet_name})
             
             self.log("설정이 모든 기능에 복사되었습니다.", LOG_SUCCESS)
     
     def _on_test_connection(self):
         """선택한 스프레드시트 연결 테스트"""
         # 현재 선택된 행
-        selected_rows = self.sheet_table.selectedIndexes()
+        selected_rows = self.sheet_table.selectionModel().selectedRows()
         if not selected_rows:
             self.log("테스트할 설정을 선택해주세요.", LOG_WARNING)
             return
         
         # 선택된 행에서 URL과 시트 이름 가져오기
         row = selected_rows[0].row()
-        function_name = self.sheet_table.item(row, 0).text()
-        spreadsheet_url = self.sheet_table.item(row, 1).text()
-        sheet_name = self.sheet_table.item(row, 2).text()
+        function_name, spreadsheet_url, sheet_name = self.sheet_model.row_values(row)
         
         # 연결 테스트 로그
         self.log(f"'{function_name}'의 스프레드시트 연결 테스트 중... URL: {spreadsheet_url}, 시트: {sheet_name}", LOG_INFO)
@@ -433,124 +684,68 @@ class SettingsSection(BaseSection):
             return
         
         # 모든 행에 URL 설정
-        for row in range(self.sheet_table.rowCount()):
-            self.sheet_table.item(row, 1).setText(bulk_url)
+        self.sheet_model.set_column(1, bulk_url)
         
         self.log(f"모든 기능에 스프레드시트 URL이 적용되었습니다: {bulk_url}", LOG_SUCCESS)
     
     def _on_save_clicked(self):
         """저장 버튼 클릭 이벤트"""
+        if not self._dirty:
+            self.log("변경 사항 없음", LOG_INFO)
+            return
+        
         try:
-            saved_values = []  # 저장된 값들을 추적
-            settings_to_save = {}  # 저장할 설정 모음
-            
-            # 일반 설정 저장
-            # 테마 설정 저장
-            theme_value = self.theme_combo.currentData()
-            get_theme().set_theme(theme_value)
-            settings_to_save[ConfigKey.UI_THEME.value] = theme_value
-            saved_values.append(f"UI 테마: {theme_value}")
-            
-            # 로그 설정 저장
-            log_level = self.log_level_combo.currentData()
-            settings_to_save[ConfigKey.LOG_LEVEL.value] = log_level
-            saved_values.append(f"로그 레벨: {log_level}")
-            
-            save_logs = self.save_log_check.isChecked()
-            settings_to_save[ConfigKey.SAVE_LOGS.value] = save_logs
-            saved_values.append(f"로그 저장: {save_logs}")
-            
-            logs_path = self.log_path_edit.text()
-            settings_to_save[ConfigKey.LOGS_PATH.value] = logs_path
-            saved_values.append(f"로그 경로: {logs_path}")
-            
-            # 카카오톡 설정 저장
-            kakao_path = self.kakao_path_edit.text()
-            settings_to_save[ConfigKey.KAKAO_PATH.value] = kakao_path
-            saved_values.append(f"카카오톡 경로: {kakao_path}")
-            
-            auto_start = self.auto_start_kakao.isChecked()
-            settings_to_save[ConfigKey.AUTO_START_KAKAO.value] = auto_start
-            saved_values.append(f"자동시작: {auto_start}")
-            
-            msg_delay = self.message_delay.value()
-            settings_to_save[ConfigKey.MESSAGE_DELAY.value] = msg_delay
-            saved_values.append(f"메시지 딜레이: {msg_delay}")
-            
-            # 스크래핑 URL 설정 저장
-            admin_url = self.swatchon_admin_url.text()
-            settings_to_save[ConfigKey.SWATCHON_ADMIN_URL.value] = admin_url
-            saved_values.append(f"SwatchOn Admin URL: {admin_url}")
-            
-            # 스크래핑 URL 저장 (모든 기능 공통)
-            receive_url = self.receive_scraping_url.text()
-            settings_to_save[ConfigKey.RECEIVE_SCRAPING_URL.value] = receive_url
-            saved_values.append(f"스크래핑 URL: {receive_url}")
-            
-            # Google API 설정 저장
-            credentials = self.credentials_path_edit.text().strip()
-            if credentials:
-                # 절대 경로로 변환
-                if not os.path.isabs(credentials):
-                    exe_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-                    credentials = os.path.join(exe_dir, credentials)
-                
-                # 파일 존재 여부 확인
-                if not os.path.exists(credentials):
-                    self.log(f"Google API 자격 증명 파일을 찾을 수 없습니다: {credentials}", LOG_ERROR)
-                    return
-                
-                # JSON 형식 검증
-                try:
-                    with open(credentials, 'r', encoding='utf-8') as f:
-                        json.load(f)
-                except json.JSONDecodeError:
-                    self.log(f"Google API 자격 증명 파일이 올바른 JSON 형식이 아닙니다: {credentials}", LOG_ERROR)
-                    return
-                except Exception as e:
-                    self.log(f"Google API 자격 증명 파일을 읽을 수 없습니다: {str(e)}", LOG_ERROR)
+            # Google API 자격 증명 파일 검증 (스프레드시트 탭이 생성된 경우에만)
+            credentials = ""
+            if self._is_tab_built(self._TAB_SPREADSHEET):
+                credentials = self._validate_credentials_path(self.credentials_path_edit.text().strip())
+                if credentials is None:
                     return
-
-            settings_to_save[ConfigKey.GOOGLE_CREDENTIALS.value] = credentials
-            saved_values.append(f"Google 자격증명: {credentials}")
             
-            api_limit = self.api_limit.value()
-            settings_to_save[ConfigKey.API_LIMIT.value] = api_limit
-            saved_values.append(f"API 제한: {api_limit}")
+            # 한 번도 열지 않은 탭은 기존 설정 값을 그대로 둔다
+            spec = [
+                entry for entry in self._save_spec
+                if self._is_tab_built(entry[0])
+            ]
             
-            # 주소록 설정 저장
-            address_url = self.address_spreadsheet_url.text().strip()
-            settings_to_save[SpreadsheetConfigKey.ADDRESS_BOOK_URL.value] = address_url
-            saved_values.append(f"주소록 URL: {address_url}")
+            # 저장할 설정 모음
+            settings_to_save = {key: getter() for _, key, getter, _ in spec}
+            if self._is_tab_built(self._TAB_SPREADSHEET):
+                settings_to_save[ConfigKey.GOOGLE_CREDENTIALS.value] = credentials
             
-            address_sheet = self.address_sheet_name.text().strip()
-            settings_to_save[SpreadsheetConfigKey.ADDRESS_BOOK_SHEET.value] = address_sheet
-            saved_values.append(f"주소록 시트: {address_sheet}")
+            # 테마 적용
+            self._theme.set_theme(settings_to_save[ConfigKey.UI_THEME.value])
             
             # 기능별 스프레드시트 설정 저장
-            row = 0
-            for section_key, section_data in SECTION_SPREADSHEET_MAPPING.items():
-                spreadsheet_url = self.sheet_table.item(row, 1).text().strip()
-                sheet_name = self.sheet_table.item(row, 2).text().strip()
-                
-                # 설정 저장 - 문자열 키를 직접 사용
-                url_key = section_data["url_key"]
-                sheet_key = section_data["sheet_key"]
-                settings_to_save[url_key] = spreadsheet_url
-                settings_to_save[sheet_key] = sheet_name
-                
-                saved_values.append(f"{section_data['name']} URL: {spreadsheet_url}")
-                saved_values.append(f"{section_data['name']} 시트: {sheet_name}")
-                
-                row += 1
+            sheet_rows = []
+            if self._is_tab_built(self._TAB_SPREADSHEET):
+                snapshot = self.sheet_model.snapshot()
+                for (name, url_key, sheet_key, _), (_, spreadsheet_url, sheet_name) in zip(self._section_rows, snapshot):
+                    spreadsheet_url = spreadsheet_url.strip()
+                    sheet_name = sheet_name.strip()
+                    
+                    # 설정 저장 - 문자열 키를 직접 사용
+                    settings_to_save[url_key] = spreadsheet_url
+                    settings_to_save[sheet_key] = sheet_name
+                    sheet_rows.append((name, spreadsheet_url, sheet_name))
+            
+            # 저장된 값 요약 (정보 이하 로그 레벨일 때만 문자열 생성)
+            saved_values = []
+            if settings_to_save[ConfigKey.LOG_LEVEL.value] in (LogType.DEBUG.value, LogType.INFO.value):
+                saved_values = [f"{label}: {settings_to_save[key]}" for _, key, _, label in spec]
+                if self._is_tab_built(self._TAB_SPREADSHEET):
+                    saved_values.append(f"Google 자격증명: {credentials}")
+                for name, spreadsheet_url, sheet_name in sheet_rows:
+                    saved_values.append(f"{name} URL: {spreadsheet_url}")
+                    saved_values.append(f"{name} 시트: {sheet_name}")
             
             # 모든 설정을 한 번에 저장
-            print("모든 설정을 일괄 저장합니다...")
+            # set_batch가 파일까지 저장하며, 실패 시 예외를 발생시킨다
             self.config_manager.set_batch(settings_to_save)
+            self._dirty = False
             
-            # 설정 파일 저장 확인
-            if not self.config_manager.save():
-                raise Exception("설정 파일 저장에 실패했습니다.")
+            # 화면 값이 곧 저장된 값이므로 다음 활성화 시 다시 로드할 필요 없음
+            self._loaded_version = self.config_manager.version
             
             # 저장된 설정 로그에 출력
             self.log("설정이 저장되었습니다:", LOG_SUCCESS)
@@ -561,50 +756,34 @@ class SettingsSection(BaseSection):
             config_path = self.config_manager.config_path
             self.log(f"설정 파일 저장 위치: {config_path}", LOG_INFO)
             
-            # 터미널에 설정 정보 출력
-            print("\n=== 저장된 설정 값 ===")
-            for value in saved_values:
-                print(value)
-            print(f"설정 파일 경로: {config_path}")
-            print("=====================\n")
-            
             # 변경 사항 알림
-            QMessageBox.information(self, "설정 저장 완료", 
-                                   "모든 설정이 성공적으로 저장되었습니다.\n일부 설정은 프로그램 재시작 후 적용됩니다.",
-                                   QMessageBox.Ok)
-            
-            # 다음 활성화 시 다시 로드할 수 있도록 플래그 재설정
-            self._settings_loaded = False
+            self._show_message_box(
+                self._info_box, "설정 저장 완료",
+                "모든 설정이 성공적으로 저장되었습니다.\n일부 설정은 프로그램 재시작 후 적용됩니다."
+            )
         
         except Exception as e:
             error_msg = f"설정 저장 중 오류가 발생했습니다: {str(e)}"
             self.log(error_msg, LOG_ERROR)
-            print(f"오류: {error_msg}")
-            print(f"오류 상세: {type(e).__name__}")
-            
-            # 스택 트레이스 출력
-            import traceback
-            traceback.print_exc()
+            self.log(f"오류 상세: {type(e).__name__}\n{traceback.format_exc()}", LOG_DEBUG)
             
-            QMessageBox.critical(self, "설정 저장 오류", 
-                               f"설정 저장 중 오류가 발생했습니다:\n{str(e)}",
-                               QMessageBox.Ok)
+            self._show_message_box(
+                self._error_box, "설정 저장 오류", f"설정 저장 중 오류가 발생했습니다:\n{str(e)}"
+            )
     
     def on_section_activated(self):
         """섹션이 활성화될 때 호출"""
-        # 이미 로드된 경우 다시 로드하지 않음
-        if self._settings_loaded:
-            print("설정이 이미 로드되어 있습니다.")
+        # 마지막 로드 이후 설정이 바뀌지 않았으면 다시 로드하지 않음
+        if self._loaded_version == self.config_manager.version:
             return
-            
-        print("설정 섹션이 활성화되었습니다.")
         
-        # 최신 설정 데이터 로드 (한 번만)
+        # 최신 설정 데이터 로드 (스프레드시트 탭이 생성된 경우에만)
+        if not self._is_tab_built(self._TAB_SPREADSHEET):
+            return
         try:
             self._load_settings()
-            self._settings_loaded = True  # 로드 완료 플래그 설정
         except Exception as e:
-            print(f"설정 로드 중 오류 발생: {str(e)}")
+            self.log(f"설정 로드 중 오류 발생: {str(e)}", LOG_ERROR)
     
     def on_section_deactivated(self):
         """섹션이 비활성화될 때 호출"""
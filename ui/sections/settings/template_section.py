@@ -1,42 +1,236 @@
 """
 템플릿 섹션 - 메시지 템플릿 관리
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QListWidget, QListWidgetItem, QFrame, QSplitter,
-    QCheckBox, QComboBox, QLineEdit, QGridLayout, QGroupBox,
-    QFormLayout, QFileDialog, QSpacerItem, QSizePolicy,
-    QTextEdit, QTabWidget, QTreeWidget, QTreeWidgetItem, QMessageBox,
-    QTableWidget, QTableWidgetItem, QHeaderView
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSplitter,
+    QComboBox, QLineEdit, QGroupBox, QFormLayout, QFileDialog,
+    QTextEdit, QTabWidget, QTreeView, QMessageBox,
+    QTableView, QHeaderView, QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal, QSize, QTimer
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex, QSaveFile, QIODevice
+from PySide6.QtGui import QGuiApplication, QStandardItemModel, QStandardItem
 
-from core.types import LogType, OrderType, FboOperationType, SboOperationType
+from core.types import OrderType, FboOperationType, SboOperationType
 from ui.sections.base_section import BaseSection
-from ui.theme import get_theme
-from core.config import ConfigManager
 from ui.components.log_widget import LOG_INFO, LOG_DEBUG, LOG_WARNING, LOG_ERROR, LOG_SUCCESS
 from services.template.template_service import TemplateService
-from ui.components.condition_dialog import ConditionDialog
-from services.api_service import ApiService
+from ui.components.condition_dialog import ConditionDialog, LEGACY_ACTION_TYPES
 from core.constants import DEFAULT_ORDER_DETAILS_FORMAT, API_FIELDS, DELIVERY_METHODS, LOGISTICS_COMPANIES
 import random
+import re
 from datetime import datetime
-from collections import Counter
+from collections import ChainMap, defaultdict
+
+# 상태 메시지
+_MSG_SECTION_ACTIVATED = "템플릿 관리 섹션이 활성화되었습니다."
+_MSG_SELECT_TEMPLATE_FIRST = "템플릿을 먼저 선택해주세요."
+_MSG_SAVE_SUCCESS = "템플릿이 성공적으로 저장되었습니다."
+_MSG_SAVE_FAILED = "템플릿 저장에 실패했습니다."
+
+# API 필드 기본값 (데이터에 없는 필드는 빈 문자열로 치환)
+_API_DEFAULTS = {k: '' for k in API_FIELDS.values()}
+
+# 템플릿 트리 표시 이름
+_FBO_NAMES = {
+    FboOperationType.SHIPMENT_REQUEST: "출고 요청",
+    FboOperationType.SHIPMENT_CONFIRM: "출고 확인",
+    FboOperationType.PO: "발주 확인 요청",
+}
+_SBO_NAMES = {
+    SboOperationType.PO: "스와치 발주",
+    SboOperationType.PICKUP_REQUEST: "픽업 요청",
+}
+
+# 조건부 템플릿 타입 변경 대상 (작업 유형 값 -> FBO 작업 유형)
+_FBO_OPERATIONS_BY_VALUE = {op_type.value: op_type for op_type in FboOperationType}
+
+# 주문 상세 정보 형식 편집기 안내 문구
+_ORDER_DETAILS_PLACEHOLDER = (
+    "주문 상세 정보 형식을 설정하세요.\n\n"
+    "기본 형식 예시:\n"
+    "[{quality_name}] | #{color_number} | {quantity}yd | {pickup_at} | {delivery_method}-{logistics_company}{swatch_request_note}\n\n"
+    "사용 가능한 변수:\n" +
+    f"- {{{API_FIELDS['ID']}}}: ID\n" +
+    f"- {{{API_FIELDS['STORE_NAME']}}}: 판매자명\n" +
+    f"- {{{API_FIELDS['QUALITY_NAME']}}}: 퀄리티명\n" +
+    f"- {{{API_FIELDS['COLOR_NUMBER']}}}: 컬러순서\n" +
+    f"- {{{API_FIELDS['COLOR_CODE']}}}: 컬러코드\n" +
+    f"- {{{API_FIELDS['QUANTITY']}}}: 수량\n" +
+    f"- {{{API_FIELDS['PURCHASE_CODE']}}}: 발주번호\n" +
+    f"- {{{API_FIELDS['PICKUP_AT']}}}: 출고일\n" +
+    f"- {{{API_FIELDS['DELIVERY_METHOD']}}}: 배송방법\n" +
+    f"- {{{API_FIELDS['LOGISTICS_COMPANY']}}}: 택배사\n" +
+    "- {order_index}: 주문 순서\n" +
+    "- {total_orders}: 전체 주문 수\n" +
+    "- {product_index}: 상품 순서\n" +
+    "- {total_products}: 전체 상품 수\n" +
+    "- {swatch_request_note}: 스와치 요청 안내 (조건부 자동 생성)"
+)
+
+# 사용 가능한 변수 목록 표시 문구
+_API_VARS = tuple(f"{{{v}}}" for v in API_FIELDS.values())
+_CUSTOM_VARS = ("{order_index}", "{total_orders}", "{product_index}", "{total_products}", "{order_details}", "{swatch_request_note}")
+_VARIABLES_TEXT = (
+    "API 필드: " + ", ".join(_API_VARS[:8]) + "...\n"
+    "커스텀 변수: " + ", ".join(_CUSTOM_VARS)
+)
+
+# 주문 상세 형식의 {변수} 토큰 (split 결과: 리터럴/변수명 교대)
+_TOKEN_RE = re.compile(r"\{(\w+)\}")
+
+
+def _condition_display(condition: Dict) -> Tuple[str, str, str, str]:
+    """조건 테이블에 표시할 (필드, 연산자, 값, 템플릿 내용) 문자열"""
+    # 이전 형식 (field)과 새로운 형식 (fields) 모두 처리
+    if "fields" in condition:
+        fields = condition["fields"]
+        if isinstance(fields, list):
+            field_text = ", ".join(fields)
+        else:
+            field_text = str(fields)
+    else:
+        field_text = condition.get("field", "")
+    
+    # 연산자 처리 (새로운 형식 지원)
+    if "operators" in condition:
+        operators = condition["operators"]
+        if isinstance(operators, dict):
+            # 필드별 연산자가 다른 경우
+            unique_ops = set(operators.values())
+            if len(unique_ops) == 1:
+                operator_text = list(unique_ops)[0]
+            else:
+                operator_text = ", ".join(f"{k}:{v}" for k, v in operators.items())
+        else:
+            operator_text = str(operators)
+    else:
+        operator_text = condition.get("operator", "")
+    
+    # 값 처리
+    value = condition.get("value", "")
+    if isinstance(value, dict):
+        value_text = ", ".join(f"{k}: {v}" for k, v in value.items())
+    else:
+        value_text = str(value)
+    
+    # 템플릿/액션 처리
+    action_type = condition.get("action_type", "내용 추가")
+    # 기존 데이터 호환성을 위해 매핑
+    action_type = LEGACY_ACTION_TYPES.get(action_type, action_type)
+    
+    if action_type == "내용 변경":
+        template_content = condition.get("template", "")
+        template_text = f"[내용 변경] {template_content[:30]}..." if len(template_content) > 30 else f"[내용 변경] {template_content}"
+    else:
+        additional_content = condition.get("template", "")
+        template_text = f"[내용 추가] {additional_content[:30]}..." if len(additional_content) > 30 else f"[내용 추가] {additional_content}"
+    
+    return field_text, operator_text, value_text, template_text
+
+
+class ConditionsModel(QAbstractTableModel):
+    """
+    조건부 템플릿 테이블 모델 (조건 dict 목록을 그대로 보관)
+    """
+    
+    HEADERS = ("필드", "연산자", "값", "템플릿 내용")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict] = []
+        self._display: List[Tuple[str, str, str, str]] = []
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._display[index.row()][index.column()]
+        if role == Qt.UserRole:
+            return self._rows[index.row()]
+        return None
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    
+    def set_conditions(self, conditions: List[Dict]):
+        """전체 조건 교체"""
+        self.beginResetModel()
+        self._rows = list(conditions)
+        self._display = [_condition_display(condition) for condition in self._rows]
+        self.endResetModel()
+    
+    def conditions(self) -> List[Dict]:
+        """현재 조건 목록"""
+        return list(self._rows)
+    
+    def condition(self, row: int) -> Dict:
+        """행의 조건 반환"""
+        return self._rows[row]
+    
+    def append_condition(self, condition: Dict):
+        """조건 한 개를 끝에 추가"""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(condition)
+        self._display.append(_condition_display(condition))
+        self.endInsertRows()
+    
+    def remove_condition(self, row: int):
+        """행의 조건 삭제"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._display[row]
+        self.endRemoveRows()
+    
+    def set_condition(self, row: int, condition: Dict):
+        """행의 조건 교체"""
+        self._rows[row] = condition
+        self._display[row] = _condition_display(condition)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1), [Qt.DisplayRole])
+
 
 class TemplateSection(BaseSection):
     """
     템플릿 섹션 - 메시지 템플릿 관리
     """
     
+    # 오른쪽 패널 탭 인덱스
+    _TAB_BASIC = 0
+    _TAB_CONDITIONS = 1
+    _TAB_PREVIEW = 2
+    
     def __init__(self, parent=None):
         super().__init__("템플릿 관리", parent)
         
+        # 조건 목록 모델 (조건 탭을 열기 전에도 로드/저장에 사용)
+        self._cond_model = ConditionsModel(self)
+        
         # 템플릿 서비스 초기화
         self.template_service = TemplateService()
         
+        # 창 크기 변경 시 스플리터 재조정 타이머 (연속 이벤트를 하나로 합침)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._set_initial_splitter_sizes)
+        
+        # 메인 스플리터 (setup_content에서 생성)
+        self._splitter: Optional[QSplitter] = None
+        
         # 저장 버튼 추가
         self.save_button = self.add_header_button("저장", self._on_save_clicked, primary=True)
         
@@ -46,6 +240,22 @@ class TemplateSection(BaseSection):
         # 현재 선택된 템플릿 정보
         self._current_order_type = None
         self._current_operation_type = None
+        
+        # 선택 시 한 번 변환해 두는 열거형 (저장/미리보기에서 재사용)
+        self._current_order_enum: Optional[OrderType] = None
+        self._current_operation_enum = None
+        
+        # 편집 영역에 표시 중인 템플릿 (order_type, operation_type)
+        self._loaded_key: Optional[Tuple[str, str]] = None
+        
+        # 주문 상세 형식 -> 토큰 분해 결과 캐시
+        self._format_cache: Dict[str, List[str]] = {}
+        
+        # 템플릿 유형별 미리보기 API 데이터 캐시 (데이터 새로고침 시 비움)
+        self._preview_data_cache: Dict[Tuple[str, str], Any] = {}
+        
+        # 직전 미리보기 입력값 (같으면 다시 생성하지 않음)
+        self._last_preview_key: Optional[tuple] = None
     
     def setup_content(self):
         """콘텐츠 설정"""
@@ -55,16 +265,24 @@ class TemplateSection(BaseSection):
         # 왼쪽 패널 (템플릿 네비게이션)
         self._setup_left_panel(main_splitter)
         
-        # 오른쪽 패널 (탭 기반 편집 영역)
-        self._setup_right_panel(main_splitter)
+        # 오른쪽 패널 (탭 기반 편집 영역은 첫 템플릿 선택 시 생성)
+        self._right_panel = QWidget()
+        right_layout = QVBoxLayout(self._right_panel)
+        right_layout.setContentsMargins(0, 0, 0, 0)
+        self._right_hint = QLabel("왼쪽 목록에서 템플릿을 선택하세요.")
+        self._right_hint.setAlignment(Qt.AlignCenter)
+        right_layout.addWidget(self._right_hint)
+        main_splitter.addWidget(self._right_panel)
         
         # 스플리터 크기 설정 (왼쪽:오른쪽 = 20%:80%)
         main_splitter.setSizes([250, 1000])
         
         # 메인 레이아웃에 스플리터 추가
         self.content_layout.addWidget(main_splitter)
+        self._splitter = main_splitter
         
-        # 스플리터 크기를 위젯이 표시된 후에 설정
+        # 트리 아이템 생성과 스플리터 크기 설정은 첫 화면 표시 후로 미룸
+        QTimer.singleShot(0, self._populate_template_tree)
         QTimer.singleShot(0, self._set_initial_splitter_sizes)
     
     def _setup_left_panel(self, parent_splitter):
@@ -73,17 +291,17 @@ class TemplateSection(BaseSection):
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(5, 5, 5, 5)
         
-        # 템플릿 트리 위젯
-        self.template_tree = QTreeWidget()
+        # 템플릿 트리 (아이템 위젯 대신 모델 기반 뷰)
+        self._template_model = QStandardItemModel(self)
+        self.template_tree = QTreeView()
+        self.template_tree.setModel(self._template_model)
         self.template_tree.setHeaderHidden(True)
-        self.template_tree.setColumnCount(1)
-        self.template_tree.setSelectionMode(QTreeWidget.SingleSelection)
-        
-        # 트리 아이템 생성
-        self._populate_template_tree()
+        self.template_tree.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.template_tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.template_tree.setUniformRowHeights(True)
         
         # 템플릿 선택 이벤트 연결
-        self.template_tree.itemClicked.connect(self._on_template_selected)
+        self.template_tree.clicked.connect(self._on_template_selected)
         
         left_layout.addWidget(QLabel("템플릿 목록"))
         left_layout.addWidget(self.template_tree)
@@ -108,24 +326,49 @@ class TemplateSection(BaseSection):
         
         parent_splitter.addWidget(left_panel)
     
-    def _setup_right_panel(self, parent_splitter):
+    def _ensure_right_panel(self):
+        """오른쪽 편집 영역이 없으면 생성해 자리표시 위젯에 넣는다"""
+        if self._right_hint is None:
+            return
+        self._right_hint.deleteLater()
+        self._right_hint = None
+        self._setup_right_panel(self._right_panel.layout())
+    
+    def _setup_right_panel(self, parent_layout):
         """오른쪽 패널 설정 - 탭 기반 편집 영역"""
         # 탭 위젯 생성
         self.tab_widget = QTabWidget()
         
-        # 기본 설정 탭
-        self._setup_basic_tab()
-        
-        # 조건부 템플릿 탭
-        self._setup_conditions_tab()
-        
-        # 미리보기 탭
-        self._setup_preview_tab()
-        
-        parent_splitter.addWidget(self.tab_widget)
+        # 기본 설정 탭은 바로 생성
+        self.tab_widget.addTab(self._setup_basic_tab(), "기본 설정")
+        
+        # 나머지 탭은 처음 선택될 때 생성 (자리표시 위젯만 추가)
+        self._tab_pages: Dict[int, QWidget] = {}
+        self._tab_builders: Dict[int, Callable[[], QWidget]] = {}
+        for index, title, builder in (
+            (self._TAB_CONDITIONS, "조건부 템플릿", self._setup_conditions_tab),
+            (self._TAB_PREVIEW, "미리보기", self._setup_preview_tab),
+        ):
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self._tab_pages[index] = page
+            self._tab_builders[index] = builder
+            self.tab_widget.addTab(page, title)
+        
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        
+        parent_layout.addWidget(self.tab_widget)
     
-    def _setup_basic_tab(self):
-        """기본 설정 탭 설정"""
+    def _ensure_tab_built(self, index: int):
+        """탭이 처음 선택되면 실제 내용을 생성해 자리표시 위젯에 넣는다"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        self._tab_pages[index].layout().addWidget(builder())
+    
+    def _setup_basic_tab(self) -> QWidget:
+        """기본 설정 탭 생성"""
         basic_tab = QWidget()
         basic_layout = QVBoxLayout(basic_tab)
         basic_layout.setContentsMargins(10, 10, 10, 10)
@@ -172,27 +415,7 @@ class TemplateSection(BaseSection):
         
         self.order_details_format = QTextEdit()
         self.order_details_format.setMinimumHeight(100)
-        self.order_details_format.setPlaceholderText(
-            "주문 상세 정보 형식을 설정하세요.\n\n"
-            "기본 형식 예시:\n"
-            "[{quality_name}] | #{color_number} | {quantity}yd | {pickup_at} | {delivery_method}-{logistics_company}{swatch_request_note}\n\n"
-            "사용 가능한 변수:\n" +
-            f"- {{{API_FIELDS['ID']}}}: ID\n" +
-            f"- {{{API_FIELDS['STORE_NAME']}}}: 판매자명\n" +
-            f"- {{{API_FIELDS['QUALITY_NAME']}}}: 퀄리티명\n" +
-            f"- {{{API_FIELDS['COLOR_NUMBER']}}}: 컬러순서\n" +
-            f"- {{{API_FIELDS['COLOR_CODE']}}}: 컬러코드\n" +
-            f"- {{{API_FIELDS['QUANTITY']}}}: 수량\n" +
-            f"- {{{API_FIELDS['PURCHASE_CODE']}}}: 발주번호\n" +
-            f"- {{{API_FIELDS['PICKUP_AT']}}}: 출고일\n" +
-            f"- {{{API_FIELDS['DELIVERY_METHOD']}}}: 배송방법\n" +
-            f"- {{{API_FIELDS['LOGISTICS_COMPANY']}}}: 택배사\n" +
-            "- {order_index}: 주문 순서\n" +
-            "- {total_orders}: 전체 주문 수\n" +
-            "- {product_index}: 상품 순서\n" +
-            "- {total_products}: 전체 상품 수\n" +
-            "- {swatch_request_note}: 스와치 요청 안내 (조건부 자동 생성)"
-        )
+        self.order_details_format.setPlaceholderText(_ORDER_DETAILS_PLACEHOLDER)
         order_details_layout.addWidget(self.order_details_format)
         edit_splitter.addWidget(order_details_group)
         
@@ -212,10 +435,10 @@ class TemplateSection(BaseSection):
         
         basic_layout.addWidget(variables_group)
         
-        self.tab_widget.addTab(basic_tab, "기본 설정")
+        return basic_tab
     
-    def _setup_conditions_tab(self):
-        """조건부 템플릿 탭 설정"""
+    def _setup_conditions_tab(self) -> QWidget:
+        """조건부 템플릿 탭 생성"""
         conditions_tab = QWidget()
         conditions_layout = QVBoxLayout(conditions_tab)
         conditions_layout.setContentsMargins(10, 10, 10, 10)
@@ -226,9 +449,8 @@ class TemplateSection(BaseSection):
         conditions_layout.addWidget(desc_label)
         
         # 조건 테이블
-        self.conditions_table = QTableWidget()
-        self.conditions_table.setColumnCount(4)
-        self.conditions_table.setHorizontalHeaderLabels(["필드", "연산자", "값", "템플릿 내용"])
+        self.conditions_table = QTableView()
+        self.conditions_table.setModel(self._cond_model)
         
         # 테이블 헤더 설정
         header = self.conditions_table.horizontalHeader()
@@ -237,9 +459,9 @@ class TemplateSection(BaseSection):
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(3, QHeaderView.Stretch)
         
-        self.conditions_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.conditions_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.conditions_table.setAlternatingRowColors(True)
-        self.conditions_table.itemDoubleClicked.connect(self._on_condition_table_double_clicked)
+        self.conditions_table.doubleClicked.connect(self._on_condition_table_double_clicked)
         
         conditions_layout.addWidget(self.conditions_table)
         
@@ -261,10 +483,10 @@ class TemplateSection(BaseSection):
         button_layout.addStretch()
         conditions_layout.addLayout(button_layout)
         
-        self.tab_widget.addTab(conditions_tab, "조건부 템플릿")
+        return conditions_tab
     
-    def _setup_preview_tab(self):
-        """미리보기 탭 설정"""
+    def _setup_preview_tab(self) -> QWidget:
+        """미리보기 탭 생성"""
         preview_tab = QWidget()
         preview_layout = QVBoxLayout(preview_tab)
         preview_layout.setContentsMargins(10, 10, 10, 10)
@@ -332,82 +554,61 @@ class TemplateSection(BaseSection):
         
         preview_layout.addWidget(result_group)
         
-        self.tab_widget.addTab(preview_tab, "미리보기")
+        return preview_tab
     
     def _update_variables_display(self):
         """변수 목록 표시 업데이트"""
-        api_vars = [f"{{{v}}}" for v in API_FIELDS.values()]
-        custom_vars = ["{order_index}", "{total_orders}", "{product_index}", "{total_products}", "{order_details}", "{swatch_request_note}"]
-        all_vars = api_vars + custom_vars
-        
-        # 변수를 그룹별로 정리
-        var_text = "API 필드: " + ", ".join(api_vars[:8]) + "...\n"
-        var_text += "커스텀 변수: " + ", ".join(custom_vars)
-        
-        self.variables_label.setText(var_text)
+        self.variables_label.setText(_VARIABLES_TEXT)
     
     def _populate_template_tree(self):
-        """템플릿 트리 아이템 생성"""
-        self.template_tree.clear()
-        
-        # FBO 카테고리
-        fbo_category = QTreeWidgetItem(self.template_tree, ["FBO (Fabric Bulk Order)"])
-        fbo_category.setExpanded(True)
-        
-        # FBO 하위 템플릿
-        for op_type in FboOperationType:
-            display_name = ""
-            if op_type == FboOperationType.SHIPMENT_REQUEST:
-                display_name = "출고 요청"
-            elif op_type == FboOperationType.SHIPMENT_CONFIRM:
-                display_name = "출고 확인"
-            elif op_type == FboOperationType.PO:
-                display_name = "발주 확인 요청"
-            
-            item = QTreeWidgetItem(fbo_category, [display_name])
-            item.setData(0, Qt.UserRole, {"order_type": OrderType.FBO.value, "operation_type": op_type.value})
-        
-        # SBO 카테고리
-        sbo_category = QTreeWidgetItem(self.template_tree, ["SBO (Swatch Box Order)"])
-        sbo_category.setExpanded(True)
-        
-        # SBO 하위 템플릿
-        for op_type in SboOperationType:
-            display_name = ""
-            if op_type == SboOperationType.PO:
-                display_name = "스와치 발주"
-            elif op_type == SboOperationType.PICKUP_REQUEST:
-                display_name = "픽업 요청"
-            
-            item = QTreeWidgetItem(sbo_category, [display_name])
-            item.setData(0, Qt.UserRole, {"order_type": OrderType.SBO.value, "operation_type": op_type.value})
+        """템플릿 트리 모델 채우기"""
+        self._template_model.clear()
+        
+        # 카테고리/하위 템플릿을 모두 만든 뒤 모델에 한 번에 추가
+        root = self._template_model.invisibleRootItem()
+        for title, order_type, operation_types, names in (
+            ("FBO (Fabric Bulk Order)", OrderType.FBO, FboOperationType, _FBO_NAMES),
+            ("SBO (Swatch Box Order)", OrderType.SBO, SboOperationType, _SBO_NAMES),
+        ):
+            category = QStandardItem(title)
+            children = []
+            for op_type in operation_types:
+                item = QStandardItem(names.get(op_type, op_type.value))
+                item.setData((order_type, op_type), Qt.UserRole)
+                children.append(item)
+            category.appendRows(children)
+            root.appendRow(category)
+        
+        # 카테고리별 setExpanded 대신 최상위 카테고리만 한 번에 펼침
+        self.template_tree.expandToDepth(0)
     
-    def _on_template_selected(self, item: QTreeWidgetItem, column: int):
+    def _on_template_selected(self, index: QModelIndex):
         """템플릿 선택 이벤트"""
-        # 상위 카테고리 항목인 경우 무시
-        if item.parent() is None:
-            return
-        
-        # 아이템 데이터 가져오기
-        data = item.data(0, Qt.UserRole)
+        # 상위 카테고리 항목은 데이터가 없으므로 무시
+        data = index.data(Qt.UserRole)
         if not data:
             return
         
+        # 편집 영역은 처음 템플릿을 선택할 때 생성
+        self._ensure_right_panel()
+        
         # 현재 선택된 템플릿 유형 저장
-        self._current_order_type = data["order_type"]
-        self._current_operation_type = data["operation_type"]
+        self._current_order_enum, self._current_operation_enum = data
+        self._current_order_type = self._current_order_enum.value
+        self._current_operation_type = self._current_operation_enum.value
         
         # 템플릿 로드
-        self._load_template(self._current_order_type, self._current_operation_type)
+        self._load_template(self._current_order_enum, self._current_operation_enum)
     
-    def _load_template(self, order_type: str, operation_type: str):
-        """템플릿 로드"""
+    def _load_template(self, order_type: OrderType, operation_type):
+        """템플릿 로드 (이미 표시 중인 템플릿이면 건너뜀)"""
+        key = (order_type.value, operation_type.value)
+        if key == self._loaded_key:
+            return
+        
         try:
             # 템플릿 서비스에서 템플릿 로드
-            template = self.template_service.load_template(
-                OrderType(order_type),
-                FboOperationType(operation_type) if order_type == OrderType.FBO.value else SboOperationType(operation_type)
-            )
+            template = self.template_service.load_template(order_type, operation_type)
             
             if template:
                 # UI 업데이트
@@ -425,71 +626,17 @@ class TemplateSection(BaseSection):
                 self.template_content.clear()
                 self.order_details_format.setText(DEFAULT_ORDER_DETAILS_FORMAT)
                 self._update_conditions_table([])
+            
+            self._loaded_key = key
                 
         except Exception as e:
+            self._loaded_key = None
             self.log(f"템플릿 로드 중 오류: {str(e)}", LOG_ERROR)
             QMessageBox.critical(self, "오류", f"템플릿 로드 중 오류가 발생했습니다:\n{str(e)}")
     
     def _update_conditions_table(self, conditions: List[Dict]):
         """조건 테이블 업데이트"""
-        self.conditions_table.setRowCount(len(conditions))
-        
-        for row, condition in enumerate(conditions):
-            # 필드 처리 (이전 형식과 새로운 형식 모두 처리)
-            if "fields" in condition:
-                fields = condition["fields"]
-                if isinstance(fields, list):
-                    field_text = ", ".join(fields)
-                else:
-                    field_text = str(fields)
-            else:
-                field_text = condition.get("field", "")
-            
-            # 연산자 처리 (새로운 형식 지원)
-            if "operators" in condition:
-                operators = condition["operators"]
-                if isinstance(operators, dict):
-                    # 필드별 연산자가 다른 경우
-                    unique_ops = set(operators.values())
-                    if len(unique_ops) == 1:
-                        operator_text = list(unique_ops)[0]
-                    else:
-                        operator_text = ", ".join(f"{k}:{v}" for k, v in operators.items())
-                else:
-                    operator_text = str(operators)
-            else:
-                operator_text = condition.get("operator", "")
-            
-            # 값 처리
-            value = condition.get("value", "")
-            if isinstance(value, dict):
-                value_text = ", ".join(f"{k}: {v}" for k, v in value.items())
-            else:
-                value_text = str(value)
-            
-            # 템플릿/액션 처리
-            action_type = condition.get("action_type", "내용 추가")
-            # 기존 데이터 호환성을 위해 매핑
-            if action_type == "템플릿 내용 변경":
-                action_type = "내용 추가"
-            elif action_type == "템플릿 타입 변경":
-                action_type = "내용 변경"
-                
-            if action_type == "내용 변경":
-                template_content = condition.get("template", "")
-                template_text = f"[내용 변경] {template_content[:30]}..." if len(template_content) > 30 else f"[내용 변경] {template_content}"
-            else:
-                additional_content = condition.get("template", "")
-                template_text = f"[내용 추가] {additional_content[:30]}..." if len(additional_content) > 30 else f"[내용 추가] {additional_content}"
-            
-            # 테이블 아이템 생성 및 원본 데이터 저장
-            field_item = QTableWidgetItem(field_text)
-            field_item.setData(Qt.UserRole, condition)  # 원본 조건 데이터 저장
-            
-            self.conditions_table.setItem(row, 0, field_item)
-            self.conditions_table.setItem(row, 1, QTableWidgetItem(operator_text))
-            self.conditions_table.setItem(row, 2, QTableWidgetItem(value_text))
-            self.conditions_table.setItem(row, 3, QTableWidgetItem(template_text))
+        self._cond_model.set_conditions(conditions)
     
     # 새로운 버튼 이벤트 핸들러들
     def _on_new_template_clicked(self):
@@ -504,115 +651,50 @@ class TemplateSection(BaseSection):
         """템플릿 삭제 버튼 클릭"""
         self.log("템플릿 삭제 기능은 아직 구현되지 않았습니다.", LOG_INFO)
     
-    def _on_condition_table_double_clicked(self, item):
+    def _on_condition_table_double_clicked(self, index):
         """조건 테이블 더블클릭 이벤트"""
         self._on_edit_condition_clicked()
     
+    def _current_condition_row(self) -> int:
+        """선택된 조건 행 (없으면 -1)"""
+        index = self.conditions_table.currentIndex()
+        return index.row() if index.isValid() else -1
+    
     def _on_edit_condition_clicked(self):
         """조건 수정 버튼 클릭"""
-        current_row = self.conditions_table.currentRow()
+        current_row = self._current_condition_row()
         if current_row < 0:
             QMessageBox.warning(self, "경고", "수정할 조건을 선택해주세요.")
             return
         
-        # 원본 조건 데이터 가져오기
-        field_item = self.conditions_table.item(current_row, 0)
-        if not field_item:
-            QMessageBox.warning(self, "경고", "조건 데이터를 찾을 수 없습니다.")
-            return
-        
-        # UserRole에서 원본 조건 데이터 가져오기
-        original_condition = field_item.data(Qt.UserRole)
-        if original_condition:
-            # 원본 데이터가 있으면 사용
-            condition = original_condition
-        else:
-            # 원본 데이터가 없으면 테이블 텍스트로 재구성 (fallback)
-            field_text = field_item.text().strip() if field_item else ""
-            operator_text = self.conditions_table.item(current_row, 1).text().strip() if self.conditions_table.item(current_row, 1) else ""
-            value_text = self.conditions_table.item(current_row, 2).text().strip() if self.conditions_table.item(current_row, 2) else ""
-            template_text = self.conditions_table.item(current_row, 3).text().strip() if self.conditions_table.item(current_row, 3) else ""
-            
-            condition = {
-                "field": field_text,
-                "operator": operator_text,
-                "value": value_text,
-                "template": template_text
-            }
-        
-        dialog = ConditionDialog(self, condition)
+        dialog = ConditionDialog(self, self._cond_model.condition(current_row))
         if dialog.exec():
-            self._update_condition_in_table(current_row, dialog.condition)
-    
-    def _update_condition_in_table(self, row: int, condition: Dict):
-        """테이블의 조건 업데이트"""
-        # 이전 형식 (field)과 새로운 형식 (fields) 모두 처리
-        if "fields" in condition:
-            fields = condition["fields"]
-            if isinstance(fields, list):
-                field_text = ", ".join(fields)
-            else:
-                field_text = str(fields)
-        else:
-            field_text = condition.get("field", "")
-        
-        # 연산자 처리 (새로운 형식 지원)
-        if "operators" in condition:
-            operators = condition["operators"]
-            if isinstance(operators, dict):
-                # 필드별 연산자가 다른 경우
-                unique_ops = set(operators.values())
-                if len(unique_ops) == 1:
-                    operator_text = list(unique_ops)[0]
-                else:
-                    operator_text = ", ".join(f"{k}:{v}" for k, v in operators.items())
-            else:
-                operator_text = str(operators)
-        else:
-            operator_text = condition.get("operator", "")
-        
-        # 값 처리
-        value = condition.get("value", "")
-        if isinstance(value, dict):
-            value_text = ", ".join(f"{k}: {v}" for k, v in value.items())
-        else:
-            value_text = str(value)
-        
-        # 템플릿/액션 처리
-        action_type = condition.get("action_type", "내용 추가")
-        # 기존 데이터 호환성을 위해 매핑
-        if action_type == "템플릿 내용 변경":
-            action_type = "내용 추가"
-        elif action_type == "템플릿 타입 변경":
-            action_type = "내용 변경"
-            
-        if action_type == "내용 변경":
-            template_content = condition.get("template", "")
-            template_text = f"[내용 변경] {template_content[:30]}..." if len(template_content) > 30 else f"[내용 변경] {template_content}"
-        else:
-            additional_content = condition.get("template", "")
-            template_text = f"[내용 추가] {additional_content[:30]}..." if len(additional_content) > 30 else f"[내용 추가] {additional_content}"
-        
-        # 필드 아이템 생성 및 원본 데이터 저장
-        field_item = QTableWidgetItem(field_text)
-        field_item.setData(Qt.UserRole, condition)  # 원본 조건 데이터 저장
-        
-        self.conditions_table.setItem(row, 0, field_item)
-        self.conditions_table.setItem(row, 1, QTableWidgetItem(operator_text))
-        self.conditions_table.setItem(row, 2, QTableWidgetItem(value_text))
-        self.conditions_table.setItem(row, 3, QTableWidgetItem(template_text))
+            self._cond_model.set_condition(current_row, dialog.condition)
     
     def _on_refresh_data_clicked(self):
         """데이터 새로고침 버튼 클릭"""
         self.log("데이터를 새로고침합니다.", LOG_INFO)
+        # 다음 미리보기에서 API 데이터를 다시 가져옴
+        self._preview_data_cache.clear()
+        self._last_preview_key = None
         # TODO: 판매자 목록 새로고침 구현
     
+    def _get_preview_api_data(self, order_type: str, operation_type: str):
+        """미리보기용 API 데이터 (새로고침 전까지 템플릿 유형별 캐시)"""
+        key = (order_type, operation_type)
+        data = self._preview_data_cache.get(key)
+        if data is None:
+            self.log(f"API 호출 시작: {order_type}/{operation_type}", LOG_INFO)
+            data = self.template_service.get_api_data(order_type, operation_type)
+            if data:
+                self._preview_data_cache[key] = data
+        return data
+    
     def _on_copy_result_clicked(self):
         """결과 복사 버튼 클릭"""
-        import pyperclip
         text = self.preview_text.toPlainText()
         if text:
-            pyperclip.copy(text)
+            QGuiApplication.clipboard().setText(text)
             self.log("미리보기 결과가 클립보드에 복사되었습니다.", LOG_SUCCESS)
         else:
             self.log("복사할 내용이 없습니다.", LOG_WARNING)
@@ -630,8 +712,13 @@ class TemplateSection(BaseSection):
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(text)
+                # 임시 파일에 쓴 뒤 commit 시 교체 (실패해도 기존 파일 보존)
+                save_file = QSaveFile(file_path)
+                if not save_file.open(QIODevice.WriteOnly):
+                    raise OSError(save_file.errorString())
+                save_file.write(text.encode("utf-8"))
+                if not save_file.commit():
+                    raise OSError(save_file.errorString())
                 self.log(f"미리보기 결과가 저장되었습니다: {file_path}", LOG_SUCCESS)
             except Exception as e:
                 self.log(f"파일 저장 중 오류: {str(e)}", LOG_ERROR)
@@ -640,21 +727,19 @@ class TemplateSection(BaseSection):
     def _on_add_condition_clicked(self):
         """조건 추가 버튼 클릭 이벤트"""
         if not self._current_order_type or not self._current_operation_type:
-            self.log("템플릿을 먼저 선택해주세요.", LOG_WARNING)
+            self.log(_MSG_SELECT_TEMPLATE_FIRST, LOG_WARNING)
             return
             
         dialog = ConditionDialog(self)
         if dialog.exec():
             # 테이블에 새 조건 추가
-            row_count = self.conditions_table.rowCount()
-            self.conditions_table.insertRow(row_count)
-            self._update_condition_in_table(row_count, dialog.condition)
+            self._cond_model.append_condition(dialog.condition)
             
             self.log("조건이 추가되었습니다.", LOG_SUCCESS)
     
     def _on_delete_condition_clicked(self):
         """조건 삭제 버튼 클릭 이벤트"""
-        current_row = self.conditions_table.currentRow()
+        current_row = self._current_condition_row()
         if current_row < 0:
             QMessageBox.warning(self, "경고", "삭제할 조건을 선택해주세요.")
             return
@@ -668,18 +753,17 @@ class TemplateSection(BaseSection):
         )
         
         if reply == QMessageBox.Yes:
-            self.conditions_table.removeRow(current_row)
+            self._cond_model.remove_condition(current_row)
             self.log("조건이 삭제되었습니다.", LOG_SUCCESS)
     
     def _on_preview_clicked(self):
         """미리보기 버튼 클릭 이벤트"""
         if not self._current_order_type or not self._current_operation_type:
-            self.log("템플릿을 먼저 선택해주세요.", LOG_WARNING)
+            self.log(_MSG_SELECT_TEMPLATE_FIRST, LOG_WARNING)
             return
             
         try:
-            self.log(f"API 호출 시작: {self._current_order_type}/{self._current_operation_type}", LOG_INFO)
-            data = self.template_service.get_api_data(self._current_order_type, self._current_operation_type)
+            data = self._get_preview_api_data(self._current_order_type, self._current_operation_type)
             if not data:
                 self.log("미리보기 데이터를 가져올 수 없습니다.", LOG_ERROR)
                 QMessageBox.warning(self, "미리보기 실패", "데이터를 가져올 수 없습니다.")
@@ -691,10 +775,25 @@ class TemplateSection(BaseSection):
                 QMessageBox.warning(self, "미리보기 실패", "데이터가 비어있습니다.")
                 return
 
-            # 날짜 필터링
+            # 미리보기 입력값 (루프에서 반복 사용하는 값은 한 번만 읽어둔다)
             target_date = self.date_edit.text().strip() or datetime.now().strftime("%Y-%m-%d")
+            selected_seller = self.seller_combo.currentText().strip()
+            order_details_format = self.order_details_format.toPlainText()
+            
+            # 입력이 직전 미리보기와 같으면 다시 생성하지 않음 (판매자 무작위 선택 시 제외)
+            preview_key = (
+                self._current_order_type, self._current_operation_type, id(data),
+                target_date, selected_seller, order_details_format,
+            )
+            if preview_key == self._last_preview_key:
+                self.log("입력이 바뀌지 않아 이전 미리보기를 유지합니다.", LOG_INFO)
+                return
+            self._last_preview_key = None
+
+            # 날짜 필터링
             self.log(f"1. {target_date} 출고 예정 데이터 필터링 시작", LOG_INFO)
-            pickup_items = [item for item in items if item.get("pickup_at", "").startswith(target_date)]
+            date_len = len(target_date)
+            pickup_items = [item for item in items if (item.get("pickup_at") or "")[:date_len] == target_date]
             
             if not pickup_items:
                 self.log(f"{target_date} 출고 예정인 데이터가 없습니다.", LOG_WARNING)
@@ -703,31 +802,31 @@ class TemplateSection(BaseSection):
                 
             self.log(f"1. 필터링 완료: {len(pickup_items)}개의 출고 예정 데이터", LOG_INFO)
 
-            # 판매자별로 데이터 그룹핑
+            # 판매자/주문번호별로 한 번에 그룹핑
             self.log("2. 판매자별 데이터 그룹핑 시작", LOG_INFO)
-            seller_groups = {}
+            groups = defaultdict(list)
             for item in pickup_items:
-                seller_name = item.get("store_name", "알 수 없음")
-                if seller_name not in seller_groups:
-                    seller_groups[seller_name] = []
-                seller_groups[seller_name].append(item)
+                groups[(item.get("store_name", "알 수 없음"), item.get("purchase_code", ""))].append(item)
+            sellers = list(dict.fromkeys(seller for seller, _ in groups))
 
             # 판매자 선택
-            selected_seller = self.seller_combo.currentText().strip()
-            if selected_seller and selected_seller in seller_groups:
+            if selected_seller and selected_seller in sellers:
                 current_seller = selected_seller
             else:
-                current_seller = random.choice(list(seller_groups.keys()))
+                current_seller = random.choice(sellers)
             
-            seller_items = seller_groups[current_seller]
+            # 선택한 판매자의 주문번호별 그룹 (입력 순서 유지)
+            order_groups = {
+                order_number: products
+                for (seller, order_number), products in groups.items()
+                if seller == current_seller
+            }
+            # 메시지 기본 데이터로 쓸 판매자의 첫 번째 아이템
+            first_item = next(iter(order_groups.values()))[0]
             
-            # 주문번호별로 그룹핑
-            order_groups = {}
-            for item in seller_items:
-                order_number = item.get("purchase_code", "")
-                if order_number not in order_groups:
-                    order_groups[order_number] = []
-                order_groups[order_number].append(item)
+            # 루프에서 반복 사용하는 매핑
+            delivery_methods = DELIVERY_METHODS
+            logistics_companies = LOGISTICS_COMPANIES
 
             # 주문별 order_details 생성
             order_details_blocks = []
@@ -737,9 +836,7 @@ class TemplateSection(BaseSection):
                 seen_identifiers = set()
                 for data in products:
                     # id와 purchase_code 조합으로 고유성 확인
-                    product_id = data.get("id", "")
-                    purchase_code = data.get("purchase_code", "")
-                    identifier = f"{product_id}_{purchase_code}"
+                    identifier = (data.get("id", ""), data.get("purchase_code", ""))
                     
                     if identifier in seen_identifiers:
                         continue
@@ -747,17 +844,20 @@ class TemplateSection(BaseSection):
                     unique_products.append(data)
                     
                 order_details_lines = []
+                total_orders = len(order_groups)
+                total_products = len(unique_products)
                 for prod_idx, data in enumerate(unique_products, 1):
-                    # 데이터 복사 및 추가 정보 설정
-                    processed_data = data.copy()
-                    processed_data["order_index"] = order_idx
-                    processed_data["total_orders"] = len(order_groups)
-                    processed_data["product_index"] = prod_idx
-                    processed_data["total_products"] = len(unique_products)
+                    # 원본은 복사하지 않고 바뀌는 값만 overlay에 담는다
+                    overlay = {
+                        "order_index": order_idx,
+                        "total_orders": total_orders,
+                        "product_index": prod_idx,
+                        "total_products": total_products,
+                    }
                     
                     # delivery_method와 logistics_company 치환
-                    delivery_method = processed_data.get("delivery_method", "")
-                    logistics_company = processed_data.get("logistics_company", "")
+                    delivery_method = data.get("delivery_method", "")
+                    logistics_company = data.get("logistics_company", "")
                     
                     # None 값을 문자열로 변환
                     if delivery_method is None:
@@ -765,35 +865,27 @@ class TemplateSection(BaseSection):
                     if logistics_company is None:
                         logistics_company = "None"
                     
+                    overlay["delivery_method"] = delivery_methods.get(delivery_method, delivery_method)
+                    overlay["logistics_company"] = logistics_companies.get(logistics_company, logistics_company)
+                    
                     # pickup_at 날짜 형식 변환 (YYYY-MM-DDTHH:MM:SS+TZ -> YYYY-MM-DD)
-                    pickup_at = processed_data.get("pickup_at", "")
-                    if pickup_at and "T" in pickup_at:
-                        pickup_at = pickup_at.split("T")[0]  # T 앞부분만 추출
-                        processed_data["pickup_at"] = pickup_at
+                    pickup_at = data.get("pickup_at", "")
+                    if pickup_at:
+                        overlay["pickup_at"] = pickup_at.partition("T")[0]  # T 앞부분만 추출 (없으면 원문)
                     
                     # quantity를 int로 변환
-                    if "quantity" in processed_data:
+                    if "quantity" in data:
                         try:
-                            processed_data["quantity"] = int(float(processed_data["quantity"]))
+                            overlay["quantity"] = int(float(data["quantity"]))
                         except (ValueError, TypeError):
                             pass
                     
-                    self.log(f"치환 전: delivery_method='{delivery_method}', logistics_company='{logistics_company}'", LOG_DEBUG)
-                    
-                    processed_data["delivery_method"] = DELIVERY_METHODS.get(delivery_method, delivery_method)
-                    processed_data["logistics_company"] = LOGISTICS_COMPANIES.get(logistics_company, logistics_company)
-                    
-                    self.log(f"치환 후: delivery_method='{processed_data['delivery_method']}', logistics_company='{processed_data['logistics_company']}'", LOG_DEBUG)
-                    
-                    order_details_format = self.order_details_format.toPlainText()
-                    order_details_line = order_details_format
-                    for k, v in {**processed_data, **{k: processed_data.get(k, '') for k in API_FIELDS.values()}}.items():
-                        order_details_line = order_details_line.replace(f"{{{k}}}", str(v))
-                    order_details_lines.append(order_details_line)
+                    lookup = ChainMap(overlay, data, _API_DEFAULTS)
+                    order_details_lines.append(self._render_order_line(order_details_format, lookup))
                     
                 # 주문별 블록 생성 (주문번호 + 상품 목록)
                 if order_details_lines:
-                    block = f"{order_idx}. {order_number}\n" + "\n".join([f"    {prod_idx}) {line}" for prod_idx, line in enumerate(order_details_lines, 1)])
+                    block = f"{order_idx}. {order_number}\n" + "\n".join(f"    {prod_idx}) {line}" for prod_idx, line in enumerate(order_details_lines, 1))
                 else:
                     # 상품이 없는 경우에도 주문번호는 표시
                     block = f"{order_idx}. {order_number}\n    (상품 정보 없음)"
@@ -801,7 +893,7 @@ class TemplateSection(BaseSection):
                 order_details_blocks.append(block)
 
             # 메시지 데이터 준비
-            msg_data = dict(seller_items[0])  # 기본 데이터는 첫 번째 아이템에서 가져옴
+            msg_data = dict(first_item)  # 기본 데이터는 첫 번째 아이템에서 가져옴
             msg_data["order_details"] = "\n".join(order_details_blocks)
             msg_data["store_name"] = current_seller
 
@@ -814,8 +906,8 @@ class TemplateSection(BaseSection):
 
             # 템플릿 렌더링
             message = self.template_service.render_message(
-                OrderType(self._current_order_type),
-                FboOperationType(self._current_operation_type) if self._current_order_type == OrderType.FBO.value else SboOperationType(self._current_operation_type),
+                self._current_order_enum,
+                self._current_operation_enum,
                 msg_data
             )
 
@@ -823,26 +915,15 @@ class TemplateSection(BaseSection):
                 # 템플릿 타입 변경 액션인지 확인
                 if isinstance(message, dict) and message.get("action") == "change_template_type":
                     target_operation = message["target_operation"]
-                    operation_map = {
-                        "shipment_request": "출고 요청",
-                        "shipment_confirm": "출고 확인",
-                        "po": "발주 확인 요청"
-                    }
-                    target_name = operation_map.get(target_operation, target_operation)
-                    
-                    # 대상 템플릿으로 다시 렌더링
+                    # 대상 템플릿으로 다시 렌더링 (FBO만 지원)
                     target_op_type = None
                     if self._current_order_type == OrderType.FBO.value:
-                        if target_operation == "shipment_request":
-                            target_op_type = FboOperationType.SHIPMENT_REQUEST
-                        elif target_operation == "shipment_confirm":
-                            target_op_type = FboOperationType.SHIPMENT_CONFIRM
-                        elif target_operation == "po":
-                            target_op_type = FboOperationType.PO
+                        target_op_type = _FBO_OPERATIONS_BY_VALUE.get(target_operation)
+                    target_name = _FBO_NAMES.get(target_op_type, target_operation)
                     
                     if target_op_type:
                         final_message = self.template_service.render_message(
-                            OrderType(self._current_order_type),
+                            self._current_order_enum,
                             target_op_type,
                             message["data"]
                         )
@@ -860,6 +941,8 @@ class TemplateSection(BaseSection):
                             except Exception as e:
                                 self.log(f"미리보기 결과 출력 중 오류: {e}", LOG_ERROR)
                             self.log(f"미리보기 생성 완료 (타입 변경): {current_seller} 판매자 → {target_name}", LOG_SUCCESS)
+                            if current_seller == selected_seller:
+                                self._last_preview_key = preview_key
                         else:
                             self.log("대상 템플릿 렌더링에 실패했습니다.", LOG_ERROR)
                     else:
@@ -878,6 +961,8 @@ class TemplateSection(BaseSection):
                     except Exception as e:
                         self.log(f"미리보기 결과 출력 중 오류: {e}", LOG_ERROR)
                     self.log(f"미리보기 생성 완료: {current_seller} 판매자", LOG_SUCCESS)
+                    if current_seller == selected_seller:
+                        self._last_preview_key = preview_key
             else:
                 self.log("미리보기 생성에 실패했습니다.", LOG_ERROR)
                 QMessageBox.warning(self, "미리보기 실패", "미리보기 생성에 실패했습니다.")
@@ -886,10 +971,23 @@ class TemplateSection(BaseSection):
             self.log(f"미리보기 생성 중 오류: {str(e)}", LOG_ERROR)
             QMessageBox.critical(self, "오류", f"미리보기 생성 중 오류가 발생했습니다:\n{str(e)}")
     
+    def _render_order_line(self, fmt: str, data) -> str:
+        """주문 상세 형식에 데이터 치환 (형식별 토큰 분해 결과는 캐시)"""
+        parts = self._format_cache.get(fmt)
+        if parts is None:
+            parts = self._format_cache[fmt] = _TOKEN_RE.split(fmt)
+        
+        # 홀수 인덱스가 변수명, 데이터에 없는 변수는 원문 그대로 둔다
+        out = parts[:]
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            out[i] = str(data[key]) if key in data else f"{{{key}}}"
+        return "".join(out)
+    
     def _on_save_clicked(self):
         """저장 버튼 클릭 이벤트"""
         if not self._current_order_type or not self._current_operation_type:
-            self.log("템플릿을 먼저 선택해주세요.", LOG_WARNING)
+            self.log(_MSG_SELECT_TEMPLATE_FIRST, LOG_WARNING)
             return
         
         # 템플릿 데이터 가져오기
@@ -901,47 +999,19 @@ class TemplateSection(BaseSection):
             self.log("제목과 내용을 모두 입력해주세요.", LOG_WARNING)
             return
         
-        # 조건 데이터 수집 (새로운 다중 필드 형식 우선 지원)
-        conditions = []
-        for row in range(self.conditions_table.rowCount()):
-            field_item = self.conditions_table.item(row, 0)
-            
-            if field_item:
-                # 원본 조건 데이터가 있는지 확인 (Qt.UserRole에 저장된 데이터)
-                original_condition = field_item.data(Qt.UserRole)
-                
-                if original_condition and isinstance(original_condition, dict):
-                    # 원본 데이터가 있으면 그대로 사용 (ConditionDialog에서 생성한 완전한 데이터)
-                    conditions.append(original_condition)
-                    self.log(f"원본 조건 데이터 사용: {original_condition.get('fields', ['Unknown'])}", LOG_DEBUG)
-                else:
-                    # 원본 데이터가 없는 경우에만 테이블에서 수집 (하위 호환성)
-                    operator_item = self.conditions_table.item(row, 1)
-                    value_item = self.conditions_table.item(row, 2)
-                    template_item = self.conditions_table.item(row, 3)
-                    
-                    if operator_item and value_item:
-                        field_text = field_item.text().strip()
-                        operator_text = operator_item.text().strip()
-                        value_text = value_item.text().strip()
-                        template_text = template_item.text() if template_item else ""
-                        
-                        if field_text:
-                            # 기존 단일 필드 형식으로 변환
-                            condition = {
-                                "field": field_text,
-                                "operator": operator_text,
-                                "value": value_text,
-                                "template": template_text
-                            }
-                            conditions.append(condition)
-                            self.log(f"테이블에서 조건 데이터 수집: {field_text}", LOG_DEBUG)
+        # 조건 데이터 수집 (ConditionDialog에서 생성한 원본 조건 그대로)
+        conditions = self._cond_model.conditions()
+        if conditions:
+            self.log("\n".join(
+                f"원본 조건 데이터 사용: {condition.get('fields', condition.get('field', 'Unknown'))}"
+                for condition in conditions
+            ), LOG_DEBUG)
         
         try:
             # 템플릿 서비스에 저장
             success = self.template_service.update_template(
-                OrderType(self._current_order_type),
-                FboOperationType(self._current_operation_type) if self._current_order_type == OrderType.FBO.value else SboOperationType(self._current_operation_type),
+                self._current_order_enum,
+                self._current_operation_enum,
                 title,
                 content,
                 order_details_format=order_details_format,
@@ -949,11 +1019,14 @@ class TemplateSection(BaseSection):
             )
             
             if success:
+                # 저장된 템플릿으로 다시 미리보기/로드 할 수 있도록 초기화
+                self._last_preview_key = None
+                self._loaded_key = None
                 self.log(f"템플릿이 저장되었습니다. 조건 개수: {len(conditions)}", LOG_SUCCESS)
-                QMessageBox.information(self, "저장 완료", "템플릿이 성공적으로 저장되었습니다.")
+                QMessageBox.information(self, "저장 완료", _MSG_SAVE_SUCCESS)
             else:
-                self.log("템플릿 저장에 실패했습니다.", LOG_ERROR)
-                QMessageBox.critical(self, "저장 실패", "템플릿 저장에 실패했습니다.")
+                self.log(_MSG_SAVE_FAILED, LOG_ERROR)
+                QMessageBox.critical(self, "저장 실패", _MSG_SAVE_FAILED)
                 
         except Exception as e:
             self.log(f"템플릿 저장 중 오류: {str(e)}", LOG_ERROR)
@@ -961,7 +1034,7 @@ class TemplateSection(BaseSection):
     
     def on_section_activated(self):
         """섹션이 활성화될 때 호출"""
-        self.log("템플릿 관리 섹션이 활성화되었습니다.", LOG_INFO)
+        self.log(_MSG_SECTION_ACTIVATED, LOG_INFO)
     
     def on_section_deactivated(self):
         """섹션이 비활성화될 때 호출"""
@@ -969,29 +1042,32 @@ class TemplateSection(BaseSection):
     
     def _set_initial_splitter_sizes(self):
         """스플리터 초기 크기 설정"""
+        splitter = self._splitter
+        if splitter is None:
+            return
         try:
-            # 메인 스플리터 찾기
-            splitter = self.content_layout.itemAt(0).widget()
-            if isinstance(splitter, QSplitter):
-                # 현재 위젯의 실제 크기 가져오기
-                total_width = self.width()
-                
-                # 왼쪽:오른쪽 = 20%:80% 비율로 설정
-                if total_width > 800:
-                    left_size = max(200, int(total_width * 0.2))
-                    right_size = total_width - left_size
-                else:
-                    left_size = min(180, int(total_width * 0.25))
-                    right_size = total_width - left_size
-                
-                splitter.setSizes([left_size, right_size])
-                        
+            # 현재 위젯의 실제 크기 가져오기
+            total_width = self.width()
+            
+            # 왼쪽:오른쪽 = 20%:80% 비율로 설정
+            if total_width > 800:
+                left_size = max(200, int(total_width * 0.2))
+                right_size = total_width - left_size
+            else:
+                left_size = min(180, int(total_width * 0.25))
+                right_size = total_width - left_size
+            
+            # 크기 계산을 모두 끝낸 뒤, 바뀐 경우에만 한 번 적용
+            sizes = [left_size, right_size]
+            if splitter.sizes() != sizes:
+                splitter.setSizes(sizes)
+                    
         except Exception as e:
             self.log(f"스플리터 크기 설정 중 오류: {str(e)}", LOG_DEBUG)
     
     def resizeEvent(self, event):
         """창 크기 변경 시 호출"""
         super().resizeEvent(event)
-        # 크기 변경 후 스플리터 크기 재조정
-        QTimer.singleShot(10, self._set_initial_splitter_sizes)
+        # 연속된 크기 변경이 끝난 뒤 스플리터 크기를 한 번만 재조정
+        self._resize_timer.start()
     
\ No newline at end of file
@@ -2,11 +2,288 @@
 테마 관리 모듈 - 다크 모드 및 라이트 모드 지원
 """
 from enum import Enum
-from typing import Dict, Any
-from PySide6.QtCore import QObject, Signal, Property, QSettings, Slot, Qt
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+from PySide6.QtCore import QObject, Signal, Property, QSettings, Slot, Qt, QTimer
 from PySide6.QtGui import QColor, QPalette
 from core.types import ThemeMode
 
+# 다크 모드 색상 (읽기 전용)
+_DARK_COLORS = MappingProxyType({
+    # 기본 색상
+    "background": "#1E1E2E",
+    "foreground": "#CDD6F4",
+    "sidebar_bg": "#181825",
+    "card_bg": "#313244",
+    
+    # 강조 색상
+    "primary": "#89B4FA",
+    "secondary": "#F5C2E7",
+    "accent": "#94E2D5",
+    
+    # 상태 색상
+    "success": "#A6E3A1",
+    "warning": "#F9E2AF",
+    "error": "#F38BA8",
+    "info": "#74C7EC",
+    
+    # 경계선 및 분리선
+    "border": "#45475A",
+    "divider": "#313244",
+    
+    # 스크롤바 및 기타
+    "scrollbar": "#45475A",
+    "scrollbar_hover": "#585B70",
+    
+    # 로그 배경
+    "log_bg": "#11111B",
+    
+    # 그림자
+    "shadow": "#00000066",
+    
+    # 텍스트 색상
+    "text_primary": "#CDD6F4",
+    "text_secondary": "#BAC2DE",
+    "text_disabled": "#6C7086",
+    
+    # 입력 필드
+    "input_bg": "#313244",
+    "input_border": "#45475A",
+    "input_focused_border": "#89B4FA",
+    
+    # 버튼 색상
+    "button_primary_bg": "#89B4FA",
+    "button_primary_fg": "#1E1E2E",
+    "button_secondary_bg": "#585B70",
+    "button_secondary_fg": "#CDD6F4",
+})
+
+# 라이트 모드 색상 (읽기 전용)
+_LIGHT_COLORS = MappingProxyType({
+    # 기본 색상
+    "background": "#EFF1F5",
+    "foreground": "#4C4F69",
+    "sidebar_bg": "#E6E9EF", 
+    "card_bg": "#DCE0E8",
+    
+    # 강조 색상
+    "primary": "#1E66F5",
+    "secondary": "#EA76CB",
+    "accent": "#179299",
+    
+    # 상태 색상
+    "success": "#40A02B",
+    "warning": "#DF8E1D",
+    "error": "#D20F39",
+    "info": "#209FB5",
+    
+    # 경계선 및 분리선
+    "border": "#BCC0CC",
+    "divider": "#DCE0E8",
+    
+    # 스크롤바 및 기타
+    "scrollbar": "#BCC0CC",
+    "scrollbar_hover": "#9CA0B0",
+    
+    # 로그 배경
+    "log_bg": "#CCD0DA",
+    
+    # 그림자
+    "shadow": "#00000033",
+    
+    # 텍스트 색상
+    "text_primary": "#4C4F69",
+    "text_secondary": "#5C5F77",
+    "text_disabled": "#ACB0BE",
+    
+    # 입력 필드
+    "input_bg": "#FFFFFF",
+    "input_border": "#BCC0CC",
+    "input_focused_border": "#1E66F5",
+    
+    # 버튼 색상
+    "button_primary_bg": "#1E66F5",
+    "button_primary_fg": "#FFFFFF",
+    "button_secondary_bg": "#DCE0E8",
+    "button_secondary_fg": "#4C4F69",
+})
+
+
+# 기본 스타일시트 템플릿 ({색상 이름}을 테마 색상으로 치환, Qt 스타일 중괄호는 이중 중괄호)
+_STYLESHEET_TEMPLATE = """
+QWidget {{
+    background-color: {background};
+    color: {text_primary};
+    font-family: 'Segoe UI', 'Noto Sans', sans-serif;
+}}
+
+QMainWindow, QDialog {{
+    background-color: {background};
+}}
+
+QScrollBar:vertical {{
+    background-color: {background};
+    width: 12px;
+    margin: 0;
+}}
+
+QScrollBar::handle:vertical {{
+    background-color: {scrollbar};
+    min-height: 20px;
+    border-radius: 6px;
+}}
+
+QScrollBar::handle:vertical:hover {{
+    background-color: {scrollbar_hover};
+}}
+
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+    height: 0px;
+}}
+
+QScrollBar:horizontal {{
+    background-color: {background};
+    height: 12px;
+    margin: 0;
+}}
+
+QScrollBar::handle:horizontal {{
+    background-color: {scrollbar};
+    min-width: 20px;
+    border-radius: 6px;
+}}
+
+QScrollBar::handle:horizontal:hover {{
+    background-color: {scrollbar_hover};
+}}
+
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+    width: 0px;
+}}
+
+QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QSpinBox {{
+    background-color: {input_bg};
+    border: 1px solid {input_border};
+    border-radius: 4px;
+    padding: 4px;
+    color: {text_primary};
+}}
+
+QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QComboBox:focus, QSpinBox:focus {{
+    border: 1px solid {input_focused_border};
+}}
+
+QPushButton {{
+    background-color: {button_secondary_bg};
+    color: {button_secondary_fg};
+    border: none;
+    border-radius: 4px;
+    padding: 6px 12px;
+    font-weight: bold;
+}}
+
+QPushButton:hover {{
+    background-color: {button_primary_bg};
+    color: {button_primary_fg};
+}}
+
+QPushButton:pressed {{
+    background-color: {primary};
+    color: {button_primary_fg};
+}}
+
+QPushButton:disabled {{
+    background-color: {button_secondary_bg};
+    color: {text_disabled};
+}}
+
+QTableView, QListView, QTreeView {{
+    background-color: {card_bg};
+    border: 1px solid {border};
+    border-radius: 4px;
+}}
+
+QTableView::item, QListView::item, QTreeView::item {{
+    padding: 4px;
+}}
+
+QTableView::item:selected, QListView::item:selected, QTreeView::item:selected {{
+    background-color: {primary};
+    color: white;
+}}
+
+QHeaderView::section {{
+    background-color: {sidebar_bg};
+    color: {text_primary};
+    padding: 4px;
+    border: none;
+    border-right: 1px solid {border};
+    border-bottom: 1px solid {border};
+}}
+
+QTabWidget::pane {{
+    border: 1px solid {border};
+    border-radius: 4px;
+}}
+
+QTabBar::tab {{
+    background-color: {sidebar_bg};
+    color: {text_primary};
+    padding: 8px 12px;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+    border: 1px solid {border};
+    margin-right: 2px;
+}}
+
+QTabBar::tab:selected {{
+    background-color: {background};
+    border-bottom-color: {background};
+}}
+
+QGroupBox {{
+    border: 1px solid {border};
+    border-radius: 4px;
+    margin-top: 1.5ex;
+}}
+
+QGroupBox::title {{
+    subcontrol-origin: margin;
+    subcontrol-position: top center;
+    padding: 0 5px;
+    color: {text_primary};
+}}
+
+QProgressBar {{
+    border: 1px solid {border};
+    border-radius: 4px;
+    text-align: center;
+    background-color: {card_bg};
+}}
+
+QProgressBar::chunk {{
+    background-color: {primary};
+    width: 1px;
+}}
+
+QMenu {{
+    background-color: {card_bg};
+    border: 1px solid {border};
+    border-radius: 4px;
+}}
+
+QMenu::item {{
+    padding: 5px 25px 5px 25px;
+}}
+
+QMenu::item:selected {{
+    background-color: {primary};
+    color: white;
+}}
+"""
+
+
 class Theme(QObject):
     """
     애플리케이션 테마 관리 클래스
@@ -19,8 +296,25 @@ class Theme(QObject):
         self._settings = QSettings("SwatchOn", "KakaoAutomation")
         self._current_theme = self._settings.value("theme", ThemeMode.SYSTEM.value)
         self._colors = self._get_theme_colors(self._current_theme)
+        self._qcolors = self._build_qcolors(self._colors)
+        
+        # 테마가 바뀔 때까지 재사용하는 스타일시트/팔레트
+        self._cached_stylesheet: Optional[str] = None
+        self._cached_palette: Optional[QPalette] = None
+        
+        # 설정 저장 지연 타이머 (연속 변경 시 마지막 값만 한 번 기록)
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._save_theme_setting)
+        
+        # 종료 직전에 대기 중인 저장이 있으면 바로 기록
+        from PySide6.QtCore import QCoreApplication
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_pending_save)
     
-    def _get_theme_colors(self, theme_name: str) -> Dict[str, Any]:
+    def _get_theme_colors(self, theme_name: str) -> Mapping[str, str]:
         """테마별 색상 정보 가져오기"""
         # 시스템 테마 적용
         if theme_name == ThemeMode.SYSTEM.value:
@@ -32,106 +326,13 @@ class Theme(QObject):
             else:
                 theme_name = ThemeMode.LIGHT.value
         
-        # 다크 모드
-        if theme_name == ThemeMode.DARK.value:
-            return {
-                # 기본 색상
-                "background": "#1E1E2E",
-                "foreground": "#CDD6F4",
-                "sidebar_bg": "#181825",
-                "card_bg": "#313244",
-                
-                # 강조 색상
-                "primary": "#89B4FA",
-                "secondary": "#F5C2E7",
-                "accent": "#94E2D5",
-                
-                # 상태 색상
-                "success": "#A6E3A1",
-                "warning": "#F9E2AF",
-                "error": "#F38BA8",
-                "info": "#74C7EC",
-                
-                # 경계선 및 분리선
-                "border": "#45475A",
-                "divider": "#313244",
-                
-                # 스크롤바 및 기타
-                "scrollbar": "#45475A",
-                "scrollbar_hover": "#585B70",
-                
-                # 로그 배경
-                "log_bg": "#11111B",
-                
-                # 그림자
-                "shadow": "#00000066",
-                
-                # 텍스트 색상
-                "text_primary": "#CDD6F4",
-                "text_secondary": "#BAC2DE",
-                "text_disabled": "#6C7086",
-                
-                # 입력 필드
-                "input_bg": "#313244",
-                "input_border": "#45475A",
-                "input_focused_border": "#89B4FA",
-                
-                # 버튼 색상
-                "button_primary_bg": "#89B4FA",
-                "button_primary_fg": "#1E1E2E",
-                "button_secondary_bg": "#585B70",
-                "button_secondary_fg": "#CDD6F4",
-            }
-        # 라이트 모드
-        else:
-            return {
-                # 기본 색상
-                "background": "#EFF1F5",
-                "foreground": "#4C4F69",
-                "sidebar_bg": "#E6E9EF", 
-                "card_bg": "#DCE0E8",
-                
-                # 강조 색상
-                "primary": "#1E66F5",
-                "secondary": "#EA76CB",
-                "accent": "#179299",
-                
-                # 상태 색상
-                "success": "#40A02B",
-                "warning": "#DF8E1D",
-                "error": "#D20F39",
-                "info": "#209FB5",
-                
-                # 경계선 및 분리선
-                "border": "#BCC0CC",
-                "divider": "#DCE0E8",
-                
-                # 스크롤바 및 기타
-                "scrollbar": "#BCC0CC",
-                "scrollbar_hover": "#9CA0B0",
-                
-                # 로그 배경
-                "log_bg": "#CCD0DA",
-                
-                # 그림자
-                "shadow": "#00000033",
-                
-                # 텍스트 색상
-                "text_primary": "#4C4F69",
-                "text_secondary": "#5C5F77",
-                "text_disabled": "#ACB0BE",
-                
-                # 입력 필드
-                "input_bg": "#FFFFFF",
-                "input_border": "#BCC0CC",
-                "input_focused_border": "#1E66F5",
-                
-                # 버튼 색상
-                "button_primary_bg": "#1E66F5",
-                "button_primary_fg": "#FFFFFF",
-                "button_secondary_bg": "#DCE0E8",
-                "button_secondary_fg": "#4C4F69",
-            }
+        # 다크 모드 / 라이트 모드
+        return _DARK_COLORS if theme_name == ThemeMode.DARK.value else _LIGHT_COLORS
+    
+    @staticmethod
+    def _build_qcolors(colors: Mapping[str, str]) -> Dict[str, QColor]:
+        """색상 이름별 QColor 미리 생성"""
+        return {name: QColor(value) for name, value in colors.items()}
     
     @Slot(str)
     def set_theme(self, theme_name: str) -> None:
@@ -141,222 +342,76 @@ class Theme(QObject):
         
         self._current_theme = theme_name
         self._colors = self._get_theme_colors(theme_name)
-        self._settings.setValue("theme", theme_name)
+        self._qcolors = self._build_qcolors(self._colors)
+        self._cached_stylesheet = None
+        self._cached_palette = None
+        self._save_timer.start()
         self.theme_changed.emit(theme_name)
     
+    def _flush_pending_save(self) -> None:
+        """대기 중인 테마 설정 저장을 즉시 수행"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._save_theme_setting()
+    
+    def _save_theme_setting(self) -> None:
+        """현재 테마를 설정에 기록"""
+        self._settings.setValue("theme", self._current_theme)
+    
     def get_color(self, color_name: str) -> str:
         """색상 가져오기"""
         return self._colors.get(color_name, "#000000")
     
+    def get_qcolor(self, color_name: str) -> QColor:
+        """색상 QColor 가져오기 (테마 변경 전까지 같은 인스턴스)"""
+        color = self._qcolors.get(color_name)
+        return color if color is not None else QColor("#000000")
+    
     def get_theme_name(self) -> str:
         """현재 테마 이름 가져오기"""
         return self._current_theme
     
     def create_palette(self) -> QPalette:
-        """현재 테마에 맞는 QPalette 생성"""
+        """현재 테마에 맞는 QPalette 생성 (테마 변경 전까지 캐시)"""
+        if self._cached_palette is not None:
+            return self._cached_palette
+        
         palette = QPalette()
         
         # 기본 색상 설정
-        palette.setColor(QPalette.Window, QColor(self.get_color("background")))
-        palette.setColor(QPalette.WindowText, QColor(self.get_color("text_primary")))
-        palette.setColor(QPalette.Base, QColor(self.get_color("card_bg")))
-        palette.setColor(QPalette.AlternateBase, QColor(self.get_color("sidebar_bg")))
-        palette.setColor(QPalette.ToolTipBase, QColor(self.get_color("card_bg")))
-        palette.setColor(QPalette.ToolTipText, QColor(self.get_color("text_primary")))
-        palette.setColor(QPalette.Text, QColor(self.get_color("text_primary")))
-        palette.setColor(QPalette.Button, QColor(self.get_color("button_secondary_bg")))
-        palette.setColor(QPalette.ButtonText, QColor(self.get_color("button_secondary_fg")))
-        palette.setColor(QPalette.Link, QColor(self.get_color("primary")))
-        palette.setColor(QPalette.Highlight, QColor(self.get_color("primary")))
+        palette.setColor(QPalette.Window, self.get_qcolor("background"))
+        palette.setColor(QPalette.WindowText, self.get_qcolor("text_primary"))
+        palette.setColor(QPalette.Base, self.get_qcolor("card_bg"))
+        palette.setColor(QPalette.AlternateBase, self.get_qcolor("sidebar_bg"))
+        palette.setColor(QPalette.ToolTipBase, self.get_qcolor("card_bg"))
+        palette.setColor(QPalette.ToolTipText, self.get_qcolor("text_primary"))
+        palette.setColor(QPalette.Text, self.get_qcolor("text_primary"))
+        palette.setColor(QPalette.Button, self.get_qcolor("button_secondary_bg"))
+        palette.setColor(QPalette.ButtonText, self.get_qcolor("button_secondary_fg"))
+        palette.setColor(QPalette.Link, self.get_qcolor("primary"))
+        palette.setColor(QPalette.Highlight, self.get_qcolor("primary"))
         palette.setColor(QPalette.HighlightedText, QColor("#FFFFFF"))
         
         # 비활성화 상태 색상
-        palette.setColor(QPalette.Disabled, QPalette.WindowText, QColor(self.get_color("text_disabled")))
-        palette.setColor(QPalette.Disabled, QPalette.Text, QColor(self.get_color("text_disabled")))
-        palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(self.get_color("text_disabled")))
+        palette.setColor(QPalette.Disabled, QPalette.WindowText, self.get_qcolor("text_disabled"))
+        palette.setColor(QPalette.Disabled, QPalette.Text, self.get_qcolor("text_disabled"))
+        palette.setColor(QPalette.Disabled, QPalette.ButtonText, self.get_qcolor("text_disabled"))
         
+        self._cached_palette = palette
         return palette
     
     def get_stylesheet(self) -> str:
-        """현재 테마에 맞는 기본 스타일시트 생성"""
-        return f"""
-        QWidget {{
-            background-color: {self.get_color("background")};
-            color: {self.get_color("text_primary")};
-            font-family: 'Segoe UI', 'Noto Sans', sans-serif;
-        }}
-        
-        QMainWindow, QDialog {{
-            background-color: {self.get_color("background")};
-        }}
-        
-        QScrollBar:vertical {{
-            background-color: {self.get_color("background")};
-            width: 12px;
-            margin: 0;
-        }}
-        
-        QScrollBar::handle:vertical {{
-            background-color: {self.get_color("scrollbar")};
-            min-height: 20px;
-            border-radius: 6px;
-        }}
-        
-        QScrollBar::handle:vertical:hover {{
-            background-color: {self.get_color("scrollbar_hover")};
-        }}
-        
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-            height: 0px;
-        }}
-        
-        QScrollBar:horizontal {{
-            background-color: {self.get_color("background")};
-            height: 12px;
-            margin: 0;
-        }}
-        
-        QScrollBar::handle:horizontal {{
-            background-color: {self.get_color("scrollbar")};
-            min-width: 20px;
-            border-radius: 6px;
-        }}
-        
-        QScrollBar::handle:horizontal:hover {{
-            background-color: {self.get_color("scrollbar_hover")};
-        }}
-        
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-            width: 0px;
-        }}
-        
-        QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QSpinBox {{
-            background-color: {self.get_color("input_bg")};
-            border: 1px solid {self.get_color("input_border")};
-            border-radius: 4px;
-            padding: 4px;
-            color: {self.get_color("text_primary")};
-        }}
-        
-        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QComboBox:focus, QSpinBox:focus {{
-            border: 1px solid {self.get_color("input_focused_border")};
-        }}
-        
-        QPushButton {{
-            background-color: {self.get_color("button_secondary_bg")};
-            color: {self.get_color("button_secondary_fg")};
-            border: none;
-            border-radius: 4px;
-            padding: 6px 12px;
-            font-weight: bold;
-        }}
-        
-        QPushButton:hover {{
-            background-color: {self.get_color("button_primary_bg")};
-            color: {self.get_color("button_primary_fg")};
-        }}
-        
-        QPushButton:pressed {{
-            background-color: {self.get_color("primary")};
-            color: {self.get_color("button_primary_fg")};
-        }}
-        
-        QPushButton:disabled {{
-            background-color: {self.get_color("button_secondary_bg")};
-            color: {self.get_color("text_disabled")};
-        }}
-        
-        QTableView, QListView, QTreeView {{
-            background-color: {self.get_color("card_bg")};
-            border: 1px solid {self.get_color("border")};
-            border-radius: 4px;
-        }}
-        
-        QTableView::item, QListView::item, QTreeView::item {{
-            padding: 4px;
-        }}
-        
-        QTableView::item:selected, QListView::item:selected, QTreeView::item:selected {{
-            background-color: {self.get_color("primary")};
-            color: white;
-        }}
-        
-        QHeaderView::section {{
-            background-color: {self.get_color("sidebar_bg")};
-            color: {self.get_color("text_primary")};
-            padding: 4px;
-            border: none;
-            border-right: 1px solid {self.get_color("border")};
-            border-bottom: 1px solid {self.get_color("border")};
-        }}
-        
-        QTabWidget::pane {{
-            border: 1px solid {self.get_color("border")};
-            border-radius: 4px;
-        }}
-        
-        QTabBar::tab {{
-            background-color: {self.get_color("sidebar_bg")};
-            color: {self.get_color("text_primary")};
-            padding: 8px 12px;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-            border: 1px solid {self.get_color("border")};
-            margin-right: 2px;
-        }}
-        
-        QTabBar::tab:selected {{
-            background-color: {self.get_color("background")};
-            border-bottom-color: {self.get_color("background")};
-        }}
-        
-        QGroupBox {{
-            border: 1px solid {self.get_color("border")};
-            border-radius: 4px;
-            margin-top: 1.5ex;
-        }}
-        
-        QGroupBox::title {{
-            subcontrol-origin: margin;
-            subcontrol-position: top center;
-            padding: 0 5px;
-            color: {self.get_color("text_primary")};
-        }}
-        
-        QProgressBar {{
-            border: 1px solid {self.get_color("border")};
-            border-radius: 4px;
-            text-align: center;
-            background-color: {self.get_color("card_bg")};
-        }}
-        
-        QProgressBar::chunk {{
-            background-color: {self.get_color("primary")};
-            width: 1px;
-        }}
-        
-        QMenu {{
-            background-color: {self.get_color("card_bg")};
-            border: 1px solid {self.get_color("border")};
-            border-radius: 4px;
-        }}
-        
-        QMenu::item {{
-            padding: 5px 25px 5px 25px;
-        }}
-        
-        QMenu::item:selected {{
-            background-color: {self.get_color("primary")};
-            color: white;
-        }}
-        """
-
-# 싱글톤 인스턴스
-_theme_instance = None
+        """현재 테마에 맞는 기본 스타일시트 생성 (테마 변경 전까지 캐시)"""
+        if self._cached_stylesheet is None:
+            self._cached_stylesheet = self._build_stylesheet()
+        return self._cached_stylesheet
+    
+    def _build_stylesheet(self) -> str:
+        """기본 스타일시트 문자열 생성"""
+        return _STYLESHEET_TEMPLATE.format_map(self._colors)
 
+# 싱글톤 인스턴스 (첫 호출 시 생성 후 캐시)
+@lru_cache(maxsize=None)
 def get_theme() -> Theme:
     """테마 싱글톤 인스턴스 가져오기"""
-    global _theme_instance
-    if _theme_instance is None:
-        _theme_instance = Theme()
-    return _theme_instance 
\ No newline at end of file
+    return Theme() 
\ No newline at end of file
@@ -1,41 +1,111 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
                              QLabel, QProgressBar, QPushButton, QTextEdit)
-from PySide6.QtCore import Qt, Signal, QThread
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool, QUrl, QElapsedTimer, QTimer
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from core.updater import Updater
-import json
+from core.update_cache import update_check_cache, update_check_key
+from core.component_manifest import ComponentManifest
+from core.bandwidth_stats import BandwidthStats
+from core.logger import get_logger
+import os
+import time
 
-class UpdateWorker(QThread):
-    progress = Signal(int)
-    status = Signal(str)
-    finished = Signal(bool)
-    
-    def __init__(self, updater: Updater, components: list):
+# 다운로드 진행률 시그널 최소 간격 (초) - GUI 이벤트 큐가 밀리지 않도록 묶어서 전달
+PROGRESS_EMIT_INTERVAL = 0.05
+
+# 진행 상태 화면 반영 간격 (ms) - 약 30fps
+PROGRESS_PAINT_INTERVAL_MS = 33
+
+# 다운로드 작업 상태 (update 시그널의 마지막 인자)
+DOWNLOAD_RUNNING = 0
+DOWNLOAD_SUCCEEDED = 1
+DOWNLOAD_FAILED = 2
+
+class WorkerSignals(QObject):
+    # QRunnable은 시그널을 가질 수 없으므로 별도 객체로 전달
+    # 진행과 완료를 한 시그널로 보내 스레드 간 큐 이벤트 수를 줄임
+    # (구성 요소 이름, 받은 바이트, 전체 바이트, 상태)
+    # 바이트 수는 2GiB 이상에서 C++ int(32비트)가 넘치므로 파이썬 객체 그대로 전달
+    update = Signal(str, object, object, int)
+
+class DownloadRunnable(QRunnable):
+    def __init__(self, updater: Updater, component: dict, signals: WorkerSignals,
+                 manifest: ComponentManifest, bandwidth: BandwidthStats):
         super().__init__()
         self.updater = updater
-        self.components = components
+        self.component = component
+        self.signals = signals
+        self.manifest = manifest
+        self.bandwidth = bandwidth
+        self._last_emit = 0.0
+        
+    def _on_bytes(self, done: int, total: int):
+        # 청크마다 호출되므로 일정 간격 이상 지났을 때만 전달 (마지막 청크는 완료 이벤트가 대신함)
+        now = time.monotonic()
+        if now - self._last_emit >= PROGRESS_EMIT_INTERVAL:
+            self._last_emit = now
+            self.signals.update.emit(self.component['name'], done, total, DOWNLOAD_RUNNING)
+        
+    def _record_manifest(self, path: str):
+        # 기록 실패는 다음에 다시 받게 될 뿐이므로 검증까지 끝난 다운로드를 실패로 보고하지 않음
+        try:
+            self.manifest.update(self.component, path)
+        except (OSError, ValueError, TypeError) as e:
+            print(f"{self.component['name']} 구성 요소 기록 실패: {str(e)}")
         
     def run(self):
         try:
-            total = len(self.components)
-            for i, component in enumerate(self.components):
-                self.status.emit(f"{component['name']} 업데이트 중...")
-                if self.updater.download_component(component):
-                    self.progress.emit(int((i + 1) / total * 100))
-                else:
-                    self.status.emit(f"{component['name']} 업데이트 실패")
-                    self.finished.emit(False)
-                    return
-            self.status.emit("업데이트 완료")
-            self.finished.emit(True)
+            # 받다 만 파일을 이어받으면 실제로 받은 양이 파일 크기보다 작아 속도 기록에서 제외
+            resumed = os.path.exists(self.updater.get_temp_path(self.component))
+            timer = QElapsedTimer()
+            timer.start()
+            success = self.updater.download_component(self.component, on_progress=self._on_bytes)
+            if success:
+                # 다음 업데이트에서 같은 구성 요소를 다시 받지 않도록 지문 기록
+                path = self.updater.get_component_path(self.component)
+                self._record_manifest(path)
+                # 다음 업데이트의 동시 다운로드 수를 정하기 위한 속도 기록
+                if not resumed:
+                    self.bandwidth.record(os.path.getsize(path), timer.elapsed())
         except Exception as e:
-            self.status.emit(f"오류 발생: {str(e)}")
-            self.finished.emit(False)
+            print(f"{self.component['name']} 다운로드 중 오류 발생: {str(e)}")
+            success = False
+        status = DOWNLOAD_SUCCEEDED if success else DOWNLOAD_FAILED
+        self.signals.update.emit(self.component['name'], 0, 0, status)
 
 class UpdateDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.logger = get_logger(__name__)
         self.setWindowTitle("업데이트")
         self.setMinimumWidth(400)
+        
+        # 구성 요소 다운로드용 스레드 풀 (앱 전역 풀의 스레드 수는 건드리지 않음)
+        # 다이얼로그가 살아 있는 동안 스레드와 시그널 객체를 재사용 (클릭마다 새로 만들지 않음)
+        self._pool = QThreadPool(self)
+        self._pool.setExpiryTimeout(-1)
+        self._signals = WorkerSignals(self)
+        self._signals.update.connect(self._on_update, Qt.QueuedConnection)
+        self._total = 0
+        self._remaining = 0
+        self._failed = []
+        self._fractions = {}
+        self._weights = {}
+        self._total_weight = 0
+        self._pct_scale = 0.0
+        self._done_weight = 0.0
+        self._last_pct = -1
+        
+        # 진행 이벤트는 값만 기록하고, 화면에는 타이머로 모아서 한 번에 반영
+        self._pending_msg = None
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setInterval(PROGRESS_PAINT_INTERVAL_MS)
+        self._paint_timer.timeout.connect(self._apply_pending_progress)
+        
+        # 업데이트 확인은 이벤트 루프에서 비동기로 처리 (별도 스레드 없이 응답 시그널로 완료)
+        self._nam = QNetworkAccessManager(self)
+        self._check_reply = None
+        self.updater = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -50,40 +120,109 @@ class UpdateDialog(QDialog):
         self.progress_bar.setRange(0, 100)
         layout.addWidget(self.progress_bar)
         
-        # 업데이트 내용
-        self.changes_text = QTextEdit()
-        self.changes_text.setReadOnly(True)
-        self.changes_text.setMaximumHeight(150)
-        layout.addWidget(self.changes_text)
+        # 업데이트 내용 (표시할 내용이 있을 때 생성)
+        self.changes_text = None
+        self._changes_slot = QVBoxLayout()
+        layout.addLayout(self._changes_slot)
         
-        # 버튼
+        # 버튼 (같은 스레드 안의 클릭 처리이므로 직접 연결)
         button_layout = QHBoxLayout()
         self.update_button = QPushButton("업데이트")
-        self.update_button.clicked.connect(self.start_update)
+        self.update_button.clicked.connect(self.start_update, Qt.DirectConnection)
+        # 첫 확인이 시작되기 전에는 다시 확인할 대상이 없으므로 비활성화
+        self.recheck_button = QPushButton("다시 확인")
+        self.recheck_button.setEnabled(False)
+        self.recheck_button.clicked.connect(lambda: self.check_updates(self.updater, force=True), Qt.DirectConnection)
         self.cancel_button = QPushButton("취소")
-        self.cancel_button.clicked.connect(self.reject)
+        self.cancel_button.clicked.connect(self.reject, Qt.DirectConnection)
         button_layout.addWidget(self.update_button)
+        button_layout.addWidget(self.recheck_button)
         button_layout.addWidget(self.cancel_button)
         layout.addLayout(button_layout)
         
         self.setLayout(layout)
         
-    def check_updates(self, updater: Updater):
-        """업데이트 확인"""
+    def check_updates(self, updater: Updater, force: bool = False):
+        """업데이트 확인 (force가 아니면 최근 확인 결과 재사용)"""
         self.updater = updater
+        self.status_label.setText("업데이트 확인 중...")
+        self.update_button.setEnabled(False)
+        self.recheck_button.setEnabled(False)
+        
+        # 최근 확인 결과가 있으면 네트워크 요청 없이 바로 표시
+        if not force:
+            hit, latest_info = update_check_cache.lookup(update_check_key(updater))
+            if hit:
+                self._apply_check_result(latest_info)
+                return
+        
+        # 진행 중인 이전 확인 요청은 취소
+        if self._check_reply is not None:
+            previous, self._check_reply = self._check_reply, None
+            previous.abort()
+        
+        request = QNetworkRequest(QUrl(updater.version_url))
+        for name, value in updater.headers.items():
+            request.setRawHeader(name.encode(), value.encode())
+        reply = self._nam.get(request)
+        reply.finished.connect(lambda: self._on_check_reply(reply))
+        self._check_reply = reply
+        
+    def _on_check_reply(self, reply: QNetworkReply):
+        """업데이트 확인 응답 처리"""
+        reply.deleteLater()
+        if reply is not self._check_reply:
+            return
+        self._check_reply = None
+        
+        if reply.error() != QNetworkReply.NoError:
+            self._on_check_error(reply.errorString())
+            return
         try:
-            # 버전 정보 확인
-            latest_info = updater.check_for_updates()
-            if latest_info:
-                self.status_label.setText(f"새로운 버전 {latest_info['tag_name']}이(가) 있습니다.")
-                self.changes_text.setText(latest_info.get('body', '업데이트 내용이 없습니다.'))
-                self.update_button.setEnabled(True)
-            else:
-                self.status_label.setText("이미 최신 버전입니다.")
-                self.update_button.setEnabled(False)
+            latest_info = self.updater.parse_version_info(reply.readAll().data())
         except Exception as e:
-            self.status_label.setText(f"업데이트 확인 중 오류 발생: {str(e)}")
+            self._on_check_error(str(e))
+            return
+        update_check_cache.store(update_check_key(self.updater), latest_info)
+        self._apply_check_result(latest_info)
+        
+    def _apply_check_result(self, latest_info):
+        """업데이트 확인 결과 반영"""
+        self.recheck_button.setEnabled(True)
+        if latest_info:
+            self.status_label.setText(f"새로운 버전 {latest_info['tag_name']}이(가) 있습니다.")
+            self._show_changes(latest_info.get('body'))
+            self.update_button.setEnabled(True)
+        else:
+            self.status_label.setText("이미 최신 버전입니다.")
             self.update_button.setEnabled(False)
+            self._show_changes(None)
+            
+    def _show_changes(self, body):
+        """업데이트 내용 표시 (내용이 없으면 텍스트 영역을 만들지 않음)"""
+        if not body:
+            if self.changes_text is not None:
+                self.changes_text.hide()
+            return
+        
+        if self.changes_text is None:
+            # 위젯 추가 중간 상태가 그려지지 않도록 한 번에 반영
+            self.setUpdatesEnabled(False)
+            try:
+                self.changes_text = QTextEdit()
+                self.changes_text.setReadOnly(True)
+                self.changes_text.setMaximumHeight(150)
+                self._changes_slot.addWidget(self.changes_text)
+            finally:
+                self.setUpdatesEnabled(True)
+        self.changes_text.setText(body)
+        self.changes_text.show()
+            
+    def _on_check_error(self, message: str):
+        """업데이트 확인 오류 처리"""
+        self.recheck_button.setEnabled(True)
+        self.status_label.setText(f"업데이트 확인 중 오류 발생: {message}")
+        self.update_button.setEnabled(False)
             
     def start_update(self):
         """업데이트 시작"""
@@ -92,22 +231,107 @@ class UpdateDialog(QDialog):
             if not components:
                 self.status_label.setText("업데이트할 구성 요소가 없습니다.")
                 return
+            
+            # 이전에 받아 둔 파일이 그대로인 구성 요소는 다시 받지 않음
+            self._manifest = ComponentManifest()
+            components = [
+                component for component in components
+                if not self._manifest.matches(component, self.updater.get_component_path(component))
+            ]
+            if not components:
+                self.status_label.setText("모든 구성 요소가 이미 최신 상태입니다.")
+                self.progress_bar.setValue(100)
+                return
                 
             self.update_button.setEnabled(False)
             self.cancel_button.setEnabled(False)
             
-            # 업데이트 작업 시작
-            self.worker = UpdateWorker(self.updater, components)
-            self.worker.progress.connect(self.progress_bar.setValue)
-            self.worker.status.connect(self.status_label.setText)
-            self.worker.finished.connect(self.update_finished)
-            self.worker.start()
+            # 구성 요소별 다운로드를 병렬로 시작
+            self._total = self._remaining = len(components)
+            self._failed = []
+            self._fractions = {}
+            # 모든 구성 요소의 크기를 알면 바이트 비율로, 아니면 구성 요소 개수로 진행률 계산
+            sizes = [component.get('size') for component in components]
+            if all(sizes):
+                self._weights = {c['name']: size for c, size in zip(components, sizes)}
+            else:
+                self._weights = dict.fromkeys((c['name'] for c in components), 1)
+            self._total_weight = sum(self._weights.values())
+            # 진행률 갱신마다 나눗셈하지 않도록 퍼센트 환산 계수를 미리 계산
+            self._pct_scale = 100 / self._total_weight
+            self._done_weight = 0.0
+            self._last_pct = 0
+            self.progress_bar.setValue(0)
+            self.status_label.setText(f"구성 요소 {self._total}개 업데이트 중...")
+            self._pending_msg = None
+            self._paint_timer.start()
+            
+            # 최근 다운로드 속도에 맞춰 동시 다운로드 수 조절 (느린 회선에서는 2~3개로 줄임)
+            self._bandwidth = BandwidthStats()
+            threads = min(self._total, self._bandwidth.suggested_threads())
+            self.logger.debug(f"다운로드 속도 중앙값: {self._bandwidth.median_mbps()} MB/s, 동시 다운로드 {threads}개")
+            self._pool.setMaxThreadCount(threads)
+            for component in components:
+                self._pool.start(DownloadRunnable(self.updater, component, self._signals,
+                                                  self._manifest, self._bandwidth))
             
         except Exception as e:
+            self._paint_timer.stop()
             self.status_label.setText(f"업데이트 시작 중 오류 발생: {str(e)}")
             self.update_button.setEnabled(True)
             self.cancel_button.setEnabled(True)
             
+    def _on_update(self, name: str, done: int, total: int, status: int):
+        """다운로드 작업의 진행/완료 이벤트 처리"""
+        if status == DOWNLOAD_RUNNING:
+            if total > 0:
+                self._set_fraction(name, done / total)
+        else:
+            self._on_component_done(status == DOWNLOAD_SUCCEEDED, name)
+        
+    def _on_component_done(self, success: bool, name: str):
+        """구성 요소 하나의 다운로드 완료 처리"""
+        self._remaining -= 1
+        if not success:
+            self._failed.append(name)
+            self._pending_msg = f"{name} 업데이트 실패"
+        self._set_fraction(name, 1.0)
+        
+        if self._remaining == 0:
+            self._bandwidth.save()
+            self._paint_timer.stop()
+            self._apply_pending_progress()
+            if self._failed:
+                self.update_finished(False)
+            else:
+                self.status_label.setText("업데이트 완료")
+                self.update_finished(True)
+            
+    def _set_fraction(self, name: str, fraction: float):
+        """구성 요소 진행 비율을 누적 가중치에 반영 (화면 반영은 _apply_pending_progress)"""
+        previous = self._fractions.get(name, 0.0)
+        self._fractions[name] = fraction
+        self._done_weight += self._weights.get(name, 0) * (fraction - previous)
+        
+        # 부동소수점 누적 오차로 99%에서 멈추지 않도록 모두 끝나면 100%
+        self._last_pct = 100 if self._remaining == 0 else int(self._done_weight * self._pct_scale)
+        
+    def _apply_pending_progress(self):
+        """기록된 진행률/상태 문구를 바뀐 경우에만 한 번의 다시 그리기로 반영"""
+        pct_changed = self._last_pct != self.progress_bar.value()
+        if not pct_changed and self._pending_msg is None:
+            return
+        
+        self.setUpdatesEnabled(False)
+        try:
+            if pct_changed:
+                self.progress_bar.setValue(self._last_pct)
+            if self._pending_msg is not None:
+                self.status_label.setText(self._pending_msg)
+                self._pending_msg = None
+        finally:
+            self.setUpdatesEnabled(True)
+            
     def update_finished(self, success: bool):
         """업데이트 완료 처리"""
         self.update_button.setEnabled(True)
@@ -115,4 +339,4 @@ class UpdateDialog(QDialog):
         if success:
             self.accept()
         else:
-            self.status_label.setText("업데이트 실패") 
\ No newline at end of file
+            self.status_label.setText(f"업데이트 실패: {', '.join(self._failed)}") 
\ No newline at end of file